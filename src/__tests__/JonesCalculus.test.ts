@@ -0,0 +1,70 @@
+/**
+ * JonesCalculus 单元测试
+ * 测试批量琼斯矢量传播
+ */
+
+import { describe, it, expect } from 'vitest'
+import {
+  applyJonesMatrix,
+  complex,
+  createJonesVectorBatch,
+  polarizerMatrix,
+  propagateJonesBatch,
+  quarterWavePlateMatrix,
+  type JonesVector,
+} from '../core/JonesCalculus'
+
+// 固定种子的线性同余发生器，保证用例可复现
+function seededRandom(seed: number): () => number {
+  let state = seed
+  return () => {
+    state = (state * 1664525 + 1013904223) % 4294967296
+    return state / 4294967296 - 0.5
+  }
+}
+
+describe('propagateJonesBatch', () => {
+  const chain = [polarizerMatrix(30), quarterWavePlateMatrix(75), polarizerMatrix(-20)]
+
+  it('与逐个 applyJonesMatrix 链式计算结果一致', () => {
+    const random = seededRandom(42)
+    const count = 8
+    const inputs: JonesVector[] = Array.from({ length: count }, () => [
+      complex.create(random(), random()),
+      complex.create(random(), random()),
+    ])
+
+    const batch = createJonesVectorBatch(count)
+    inputs.forEach(([ex, ey], i) => {
+      batch.exRe[i] = ex.re
+      batch.exIm[i] = ex.im
+      batch.eyRe[i] = ey.re
+      batch.eyIm[i] = ey.im
+    })
+    const out = propagateJonesBatch(batch, chain, createJonesVectorBatch(count))
+
+    inputs.forEach((input, i) => {
+      const [ex, ey] = chain.reduce((vec, matrix) => applyJonesMatrix(matrix, vec), input)
+      expect(out.exRe[i]).toBeCloseTo(ex.re, 12)
+      expect(out.exIm[i]).toBeCloseTo(ex.im, 12)
+      expect(out.eyRe[i]).toBeCloseTo(ey.re, 12)
+      expect(out.eyIm[i]).toBeCloseTo(ey.im, 12)
+    })
+  })
+
+  it('输出可与输入共用同一缓冲区', () => {
+    const batch = createJonesVectorBatch(1)
+    batch.exRe[0] = 0.6
+    batch.eyIm[0] = -0.8
+    const [ex, ey] = chain.reduce(
+      (vec, matrix) => applyJonesMatrix(matrix, vec),
+      [complex.create(0.6), complex.create(0, -0.8)] as JonesVector
+    )
+
+    propagateJonesBatch(batch, chain, batch)
+    expect(batch.exRe[0]).toBeCloseTo(ex.re, 12)
+    expect(batch.exIm[0]).toBeCloseTo(ex.im, 12)
+    expect(batch.eyRe[0]).toBeCloseTo(ey.re, 12)
+    expect(batch.eyIm[0]).toBeCloseTo(ey.im, 12)
+  })
+})
@@ -0,0 +1,51 @@
+/**
+ * opticsPhysics 单元测试
+ * 测试菲涅尔反射率批量扫描
+ */
+
+import { describe, it, expect } from 'vitest'
+import {
+  createAngleTrigTable,
+  createFresnelSweepBuffers,
+  fresnelReflectanceSweep,
+} from '../lib/opticsPhysics'
+
+function sweep(anglesDeg: number[], n1: number, n2: number) {
+  const trig = createAngleTrigTable(Float64Array.from(anglesDeg))
+  const out = createFresnelSweepBuffers(anglesDeg.length)
+  fresnelReflectanceSweep(trig, n1, n2, out)
+  return out
+}
+
+describe('fresnelReflectanceSweep', () => {
+  it('垂直入射时 Rs = Rp = ((n1 - n2) / (n1 + n2))²', () => {
+    const { Rs, Rp } = sweep([0], 1, 1.5)
+    expect(Rs[0]).toBeCloseTo(0.04, 10)
+    expect(Rp[0]).toBeCloseTo(0.04, 10)
+  })
+
+  it('布儒斯特角处 p 偏振反射率为 0', () => {
+    const brewster = (Math.atan(1.5) * 180) / Math.PI
+    const { Rs, Rp } = sweep([brewster], 1, 1.5)
+    expect(Rp[0]).toBeCloseTo(0, 10)
+    expect(Rs[0]).toBeGreaterThan(0)
+  })
+
+  it('超过临界角时发生全内反射，Rs = Rp = 1', () => {
+    const { Rs, Rp } = sweep([30, 60], 1.5, 1)
+    expect(Rs[0]).toBeLessThan(1)
+    expect(Rs[1]).toBeCloseTo(1, 10)
+    expect(Rp[1]).toBeCloseTo(1, 10)
+  })
+
+  it('从空气入射的特化版本与一般公式一致', () => {
+    const angles = [10, 35, 70]
+    const fromAir = sweep(angles, 1, 1.33)
+    // n1 取极接近 1 的值走一般分支
+    const general = sweep(angles, 1 + 1e-12, 1.33)
+    for (let i = 0; i < angles.length; i++) {
+      expect(fromAir.Rs[i]).toBeCloseTo(general.Rs[i], 8)
+      expect(fromAir.Rp[i]).toBeCloseTo(general.Rp[i], 8)
+    }
+  })
+})
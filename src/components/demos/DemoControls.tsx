@@ -3,7 +3,7 @@
  * 提供滑块、按钮、预设等交互控件
  * 支持亮色/暗色主题
  */
-import { ReactNode } from 'react'
+import { ReactNode, memo } from 'react'
 import { cn } from '@/lib/utils'
 import { useTheme } from '@/contexts/ThemeContext'
 
@@ -53,7 +53,8 @@ const sliderColorClasses: Record<string, { track: string; thumb: string; glow: s
   },
 }
 
-export function SliderControl({
+// 滑块控件用 memo 包裹：拖动某一个滑块时，同一面板里参数未变的其他滑块不重渲染
+export const SliderControl = memo(function SliderControl({
   label,
   value,
   min,
@@ -90,7 +91,11 @@ export function SliderControl({
           max={max}
           step={step}
           value={value}
-          onChange={(e) => onChange(parseFloat(e.target.value))}
+          onChange={(e) => {
+            // 值未变化时不触发上层更新（避免整幅演示图重绘）
+            const next = parseFloat(e.target.value)
+            if (next !== value) onChange(next)
+          }}
           className={cn(
             'w-full h-2 rounded-lg appearance-none cursor-pointer relative',
             theme === 'dark' ? 'bg-slate-700' : 'bg-gray-200',
@@ -116,7 +121,7 @@ export function SliderControl({
       </div>
     </div>
   )
-}
+})
 
 // 预设按钮组 - 新增组件
 interface PresetButtonsProps {
@@ -45,6 +45,36 @@ const KEY_ANGLES = [
   { angle: 90, transmission: 0, label: '90°', description: 'Complete blocking' },
 ]
 
+// 图形参数
+const GRAPH_CONFIG = {
+  width: 400,
+  height: 200,
+  startX: 80,
+  startY: 50,
+  padding: 40,
+}
+
+// 曲线与关键点只依赖固定的图形参数，模块加载时算好一次，之后每次渲染直接复用
+const CURVE_PATH = generateCosSquaredPath(
+  GRAPH_CONFIG.width,
+  GRAPH_CONFIG.height,
+  GRAPH_CONFIG.startX,
+  GRAPH_CONFIG.startY
+)
+
+// 关键点坐标：透射率直接取自 KEY_ANGLES（百分比），一次算出图上位置，渲染时只读结果
+const KEY_POINT_COORDS = (() => {
+  const count = KEY_ANGLES.length
+  const xs = new Float64Array(count)
+  const ys = new Float64Array(count)
+  for (let i = 0; i < count; i++) {
+    const { angle, transmission } = KEY_ANGLES[i]
+    xs[i] = GRAPH_CONFIG.startX + (angle / 180) * GRAPH_CONFIG.width
+    ys[i] = GRAPH_CONFIG.startY + GRAPH_CONFIG.height - (transmission / 100) * GRAPH_CONFIG.height
+  }
+  return { xs, ys }
+})()
+
 // 预设角度
 const ANGLE_PRESETS = [
   { value: 0, label: '0°' },
@@ -76,21 +106,12 @@ export function MalusLawGraphDemo() {
     return Math.cos((normalizedAngle * Math.PI) / 180) ** 2
   }, [angle])
 
-  // 图形参数
-  const graphConfig = {
-    width: 400,
-    height: 200,
-    startX: 80,
-    startY: 50,
-    padding: 40,
-  }
-
   // 当前角度在图上的位置
   const currentPoint = useMemo(() => {
     const normalizedAngle = angle % 180
     return {
-      x: graphConfig.startX + (normalizedAngle / 180) * graphConfig.width,
-      y: graphConfig.startY + graphConfig.height - transmission * graphConfig.height,
+      x: GRAPH_CONFIG.startX + (normalizedAngle / 180) * GRAPH_CONFIG.width,
+      y: GRAPH_CONFIG.startY + GRAPH_CONFIG.height - transmission * GRAPH_CONFIG.height,
     }
   }, [angle, transmission])
 
@@ -110,12 +131,6 @@ export function MalusLawGraphDemo() {
     return () => clearInterval(interval)
   }, [animationSpeed])
 
-  // cos²曲线路径
-  const curvePath = useMemo(
-    () => generateCosSquaredPath(graphConfig.width, graphConfig.height, graphConfig.startX, graphConfig.startY),
-    []
-  )
-
   return (
     <div className="space-y-6">
       <div className="flex gap-6 flex-col lg:flex-row">
@@ -165,37 +180,37 @@ export function MalusLawGraphDemo() {
               <g>
                 {/* Y轴 */}
                 <line
-                  x1={graphConfig.startX}
-                  y1={graphConfig.startY}
-                  x2={graphConfig.startX}
-                  y2={graphConfig.startY + graphConfig.height}
+                  x1={GRAPH_CONFIG.startX}
+                  y1={GRAPH_CONFIG.startY}
+                  x2={GRAPH_CONFIG.startX}
+                  y2={GRAPH_CONFIG.startY + GRAPH_CONFIG.height}
                   stroke="#475569"
                   strokeWidth="2"
                 />
                 {/* Y轴箭头 */}
                 <polygon
-                  points={`${graphConfig.startX},${graphConfig.startY - 5} ${graphConfig.startX - 5},${graphConfig.startY + 5} ${graphConfig.startX + 5},${graphConfig.startY + 5}`}
+                  points={`${GRAPH_CONFIG.startX},${GRAPH_CONFIG.startY - 5} ${GRAPH_CONFIG.startX - 5},${GRAPH_CONFIG.startY + 5} ${GRAPH_CONFIG.startX + 5},${GRAPH_CONFIG.startY + 5}`}
                   fill="#475569"
                 />
                 {/* Y轴标签 */}
-                <text x={graphConfig.startX - 10} y={graphConfig.startY - 15} textAnchor="middle" fill="#9ca3af" fontSize="12">
+                <text x={GRAPH_CONFIG.startX - 10} y={GRAPH_CONFIG.startY - 15} textAnchor="middle" fill="#9ca3af" fontSize="12">
                   I/I₀
                 </text>
 
                 {/* Y轴刻度 */}
                 {[0, 0.25, 0.5, 0.75, 1].map((v) => {
-                  const y = graphConfig.startY + graphConfig.height - v * graphConfig.height
+                  const y = GRAPH_CONFIG.startY + GRAPH_CONFIG.height - v * GRAPH_CONFIG.height
                   return (
                     <g key={v}>
-                      <line x1={graphConfig.startX - 5} y1={y} x2={graphConfig.startX} y2={y} stroke="#475569" strokeWidth="1" />
-                      <text x={graphConfig.startX - 15} y={y + 4} textAnchor="end" fill="#6b7280" fontSize="10">
+                      <line x1={GRAPH_CONFIG.startX - 5} y1={y} x2={GRAPH_CONFIG.startX} y2={y} stroke="#475569" strokeWidth="1" />
+                      <text x={GRAPH_CONFIG.startX - 15} y={y + 4} textAnchor="end" fill="#6b7280" fontSize="10">
                         {(v * 100).toFixed(0)}%
                       </text>
                       {/* 网格线 */}
                       <line
-                        x1={graphConfig.startX}
+                        x1={GRAPH_CONFIG.startX}
                         y1={y}
-                        x2={graphConfig.startX + graphConfig.width}
+                        x2={GRAPH_CONFIG.startX + GRAPH_CONFIG.width}
                         y2={y}
                         stroke="#334155"
                         strokeWidth="0.5"
@@ -207,22 +222,22 @@ export function MalusLawGraphDemo() {
 
                 {/* X轴 */}
                 <line
-                  x1={graphConfig.startX}
-                  y1={graphConfig.startY + graphConfig.height}
-                  x2={graphConfig.startX + graphConfig.width}
-                  y2={graphConfig.startY + graphConfig.height}
+                  x1={GRAPH_CONFIG.startX}
+                  y1={GRAPH_CONFIG.startY + GRAPH_CONFIG.height}
+                  x2={GRAPH_CONFIG.startX + GRAPH_CONFIG.width}
+                  y2={GRAPH_CONFIG.startY + GRAPH_CONFIG.height}
                   stroke="#475569"
                   strokeWidth="2"
                 />
                 {/* X轴箭头 */}
                 <polygon
-                  points={`${graphConfig.startX + graphConfig.width + 5},${graphConfig.startY + graphConfig.height} ${graphConfig.startX + graphConfig.width - 5},${graphConfig.startY + graphConfig.height - 5} ${graphConfig.startX + graphConfig.width - 5},${graphConfig.startY + graphConfig.height + 5}`}
+                  points={`${GRAPH_CONFIG.startX + GRAPH_CONFIG.width + 5},${GRAPH_CONFIG.startY + GRAPH_CONFIG.height} ${GRAPH_CONFIG.startX + GRAPH_CONFIG.width - 5},${GRAPH_CONFIG.startY + GRAPH_CONFIG.height - 5} ${GRAPH_CONFIG.startX + GRAPH_CONFIG.width - 5},${GRAPH_CONFIG.startY + GRAPH_CONFIG.height + 5}`}
                   fill="#475569"
                 />
                 {/* X轴标签 */}
                 <text
-                  x={graphConfig.startX + graphConfig.width + 20}
-                  y={graphConfig.startY + graphConfig.height + 5}
+                  x={GRAPH_CONFIG.startX + GRAPH_CONFIG.width + 20}
+                  y={GRAPH_CONFIG.startY + GRAPH_CONFIG.height + 5}
                   textAnchor="start"
                   fill="#9ca3af"
                   fontSize="12"
@@ -232,21 +247,21 @@ export function MalusLawGraphDemo() {
 
                 {/* X轴刻度 */}
                 {[0, 30, 45, 60, 90, 120, 135, 150, 180].map((a) => {
-                  const x = graphConfig.startX + (a / 180) * graphConfig.width
+                  const x = GRAPH_CONFIG.startX + (a / 180) * GRAPH_CONFIG.width
                   const isKey = [0, 45, 90, 135, 180].includes(a)
                   return (
                     <g key={a}>
                       <line
                         x1={x}
-                        y1={graphConfig.startY + graphConfig.height}
+                        y1={GRAPH_CONFIG.startY + GRAPH_CONFIG.height}
                         x2={x}
-                        y2={graphConfig.startY + graphConfig.height + 5}
+                        y2={GRAPH_CONFIG.startY + GRAPH_CONFIG.height + 5}
                         stroke="#475569"
                         strokeWidth="1"
                       />
                       <text
                         x={x}
-                        y={graphConfig.startY + graphConfig.height + 18}
+                        y={GRAPH_CONFIG.startY + GRAPH_CONFIG.height + 18}
                         textAnchor="middle"
                         fill={isKey ? '#9ca3af' : '#4b5563'}
                         fontSize="10"
@@ -257,9 +272,9 @@ export function MalusLawGraphDemo() {
                       {isKey && (
                         <line
                           x1={x}
-                          y1={graphConfig.startY}
+                          y1={GRAPH_CONFIG.startY}
                           x2={x}
-                          y2={graphConfig.startY + graphConfig.height}
+                          y2={GRAPH_CONFIG.startY + GRAPH_CONFIG.height}
                           stroke="#334155"
                           strokeWidth="0.5"
                           strokeDasharray="4 4"
@@ -271,7 +286,7 @@ export function MalusLawGraphDemo() {
 
                 {/* cos²曲线 */}
                 <motion.path
-                  d={curvePath}
+                  d={CURVE_PATH}
                   fill="none"
                   stroke="url(#curve-gradient)"
                   strokeWidth="3"
@@ -283,23 +298,19 @@ export function MalusLawGraphDemo() {
 
                 {/* 填充区域 */}
                 <path
-                  d={`${curvePath} L ${graphConfig.startX + graphConfig.width},${graphConfig.startY + graphConfig.height} L ${graphConfig.startX},${graphConfig.startY + graphConfig.height} Z`}
+                  d={`${CURVE_PATH} L ${GRAPH_CONFIG.startX + GRAPH_CONFIG.width},${GRAPH_CONFIG.startY + GRAPH_CONFIG.height} L ${GRAPH_CONFIG.startX},${GRAPH_CONFIG.startY + GRAPH_CONFIG.height} Z`}
                   fill="url(#curve-gradient)"
                   opacity="0.1"
                 />
 
                 {/* 关键点标注 */}
                 {showKeyPoints &&
-                  KEY_ANGLES.map((point) => {
-                    const x = graphConfig.startX + (point.angle / 180) * graphConfig.width
-                    const y = graphConfig.startY + graphConfig.height - (point.transmission / 100) * graphConfig.height
-                    return (
-                      <g key={point.angle}>
-                        <circle cx={x} cy={y} r="5" fill="#22d3ee" opacity="0.8" />
-                        <circle cx={x} cy={y} r="3" fill="#fff" />
-                      </g>
-                    )
-                  })}
+                  KEY_ANGLES.map((point, i) => (
+                    <g key={point.angle}>
+                      <circle cx={KEY_POINT_COORDS.xs[i]} cy={KEY_POINT_COORDS.ys[i]} r="5" fill="#22d3ee" opacity="0.8" />
+                      <circle cx={KEY_POINT_COORDS.xs[i]} cy={KEY_POINT_COORDS.ys[i]} r="3" fill="#fff" />
+                    </g>
+                  ))}
 
                 {/* 当前角度指示器 */}
                 <motion.g
@@ -314,7 +325,7 @@ export function MalusLawGraphDemo() {
                     x1={0}
                     y1={0}
                     x2={0}
-                    y2={graphConfig.startY + graphConfig.height - currentPoint.y}
+                    y2={GRAPH_CONFIG.startY + GRAPH_CONFIG.height - currentPoint.y}
                     stroke="#fbbf24"
                     strokeWidth="1"
                     strokeDasharray="4 2"
@@ -325,7 +336,7 @@ export function MalusLawGraphDemo() {
                   <line
                     x1={0}
                     y1={0}
-                    x2={graphConfig.startX - currentPoint.x}
+                    x2={GRAPH_CONFIG.startX - currentPoint.x}
                     y2={0}
                     stroke="#fbbf24"
                     strokeWidth="1"
@@ -339,7 +350,7 @@ export function MalusLawGraphDemo() {
                 </motion.g>
 
                 {/* 当前值标注 */}
-                <g transform={`translate(${currentPoint.x}, ${Math.max(currentPoint.y - 30, graphConfig.startY + 10)})`}>
+                <g transform={`translate(${currentPoint.x}, ${Math.max(currentPoint.y - 30, GRAPH_CONFIG.startY + 10)})`}>
                   <rect x="-35" y="-12" width="70" height="24" rx="4" fill="rgba(251,191,36,0.2)" stroke="#fbbf24" strokeWidth="1" />
                   <text x="0" y="5" textAnchor="middle" fill="#fbbf24" fontSize="11" fontWeight="bold">
                     {(transmission * 100).toFixed(1)}%
@@ -2,8 +2,8 @@
  * 双折射效应演示 - Unit 1
  * 使用React Three Fiber 3D可视化，可自由拖动旋转
  */
-import { useState, useRef, useMemo } from 'react'
-import { Canvas, useFrame } from '@react-three/fiber'
+import { useState, useRef, useMemo, useEffect } from 'react'
+import { Canvas, useFrame, useThree } from '@react-three/fiber'
 import { OrbitControls, Line, Text } from '@react-three/drei'
 import * as THREE from 'three'
 import { motion, AnimatePresence } from 'framer-motion'
@@ -17,16 +17,132 @@ import {
 import { ThicknessVisualizer, StressComparator } from '@/components/gallery'
 import { FlaskConical, Box, Beaker } from 'lucide-react'
 
+// 方解石折射率（标准值）及双折射率差，均为常量，模块加载时算好
+const CALCITE_NO = 1.6584 // o光折射率
+const CALCITE_NE = 1.4864 // e光折射率
+const CALCITE_BIREFRINGENCE = Math.abs(CALCITE_NO - CALCITE_NE)
+const CALCITE_INDEX_LABEL = `no=${CALCITE_NO.toFixed(4)} ne=${CALCITE_NE.toFixed(4)}`
+
+// cos²θ 查找表：滑块步进为整数度，θ 归一化到 [0, 180) 后直接查表
+const COS2_TABLE = (() => {
+  const table = new Float64Array(180)
+  for (let deg = 0; deg < 180; deg++) {
+    const c = Math.cos((deg * Math.PI) / 180)
+    table[deg] = c * c
+  }
+  return table
+})()
+
+// 强度百分比显示文本，与 COS2_TABLE 同样按整数度索引，滑块拖动时无需再格式化
+const O_PERCENT_TEXT = Array.from(COS2_TABLE, (c2) => (c2 * 100).toFixed(1))
+const E_PERCENT_TEXT = Array.from(COS2_TABLE, (c2) => ((1 - c2) * 100).toFixed(1))
+
+// 角度归一化到 [0, 180)
+function normalizeDeg180(deg: number): number {
+  return ((deg % 180) + 180) % 180
+}
+
+/**
+ * 双折射强度分配（马吕斯定律）
+ * - o光：I_o = cos²θ
+ * - e光：I_e = 1 - I_o（即 sin²θ，能量守恒由构造保证）
+ * 整数角度走查表，非整数角度回退到直接计算
+ */
+function birefringenceIntensities(thetaDeg: number): { oIntensity: number; eIntensity: number } {
+  let oIntensity: number
+  if (Number.isInteger(thetaDeg)) {
+    oIntensity = COS2_TABLE[normalizeDeg180(thetaDeg)]
+  } else {
+    const c = Math.cos((thetaDeg * Math.PI) / 180)
+    oIntensity = c * c
+  }
+  return { oIntensity, eIntensity: 1 - oIntensity }
+}
+
+// 强度百分比文本：整数角度查表，非整数角度现场格式化
+function intensityPercentText(thetaDeg: number): { oText: string; eText: string } {
+  if (Number.isInteger(thetaDeg)) {
+    const index = normalizeDeg180(thetaDeg)
+    return { oText: O_PERCENT_TEXT[index], eText: E_PERCENT_TEXT[index] }
+  }
+  const { oIntensity, eIntensity } = birefringenceIntensities(thetaDeg)
+  return { oText: (oIntensity * 100).toFixed(1), eText: (eIntensity * 100).toFixed(1) }
+}
+
+// 由控制参数推导出的双折射状态，场景和信息面板共用同一份
+interface BirefringenceState {
+  effectivePolarization: number
+  oIntensity: number
+  eIntensity: number
+  oText: string
+  eText: string
+  separationFactor: number
+  oOffsetY: number
+  oOffsetZ: number
+  eOffsetY: number
+  eOffsetZ: number
+}
+
+function computeBirefringenceState(
+  inputPolarization: number,
+  opticalAxisAngle: number,
+  envRefractiveIndex: number
+): BirefringenceState {
+  // 计算有效的偏振角度（相对于光轴方向）
+  const effectivePolarization = inputPolarization - opticalAxisAngle
+  // o光强度 = cos²θ，e光强度 = sin²θ（与o光互补，总和为1）
+  const { oIntensity, eIntensity } = birefringenceIntensities(effectivePolarization)
+  const { oText, eText } = intensityPercentText(effectivePolarization)
+
+  // 计算折射导致的光束偏移（基于斯涅尔定律）
+  // 环境折射率对光束分离的影响因子
+  const separationFactor = CALCITE_BIREFRINGENCE / envRefractiveIndex
+
+  // o光和e光的分离角度（基于光轴方向）
+  const axisRad = (opticalAxisAngle * Math.PI) / 180
+  const baseSeparation = 0.5 * (1 + separationFactor * 2)
+
+  // o光向垂直于光轴方向偏折，e光沿光轴方向偏折（两束光关于轴对称，共用同一组 cos/sin）
+  const oOffsetY = baseSeparation * Math.cos(axisRad)
+  const oOffsetZ = baseSeparation * Math.sin(axisRad) * 0.3
+
+  return {
+    effectivePolarization,
+    oIntensity,
+    eIntensity,
+    oText,
+    eText,
+    separationFactor,
+    oOffsetY,
+    oOffsetZ,
+    eOffsetY: -oOffsetY,
+    eOffsetZ: -oOffsetZ,
+  }
+}
+
 // 光源组件
-function LightSource({ position }: { position: [number, number, number] }) {
+function LightSource({
+  position,
+  animate,
+}: {
+  position: [number, number, number]
+  animate: boolean
+}) {
   const ref = useRef<THREE.Mesh>(null)
+  const invalidate = useThree((s) => s.invalidate)
 
   useFrame(({ clock }) => {
     if (ref.current) {
-      ref.current.scale.setScalar(1 + Math.sin(clock.getElapsedTime() * 3) * 0.1)
+      // 暂停时脉动归位，而不是停在半途
+      ref.current.scale.setScalar(animate ? 1 + Math.sin(clock.getElapsedTime() * 3) * 0.1 : 1)
     }
   })
 
+  // 按需渲染模式下，播放/暂停切换时主动请求一帧
+  useEffect(() => {
+    invalidate()
+  }, [invalidate, animate])
+
   return (
     <group position={position}>
       <mesh ref={ref}>
@@ -45,34 +161,53 @@ function LightSource({ position }: { position: [number, number, number] }) {
   )
 }
 
+// 晶体边框几何体：尺寸固定，全局只构建一次
+// （以 args 传入新建的 BoxGeometry 会让每次渲染都重建边框）
+const CRYSTAL_EDGES_GEOMETRY = (() => {
+  const box = new THREE.BoxGeometry(1.5, 1.5, 1)
+  const edges = new THREE.EdgesGeometry(box)
+  box.dispose()
+  return edges
+})()
+
 // 方解石晶体组件
 function CalciteCrystal({
   position,
   rotation,
   opticalAxisAngle,
-  no,
-  ne,
+  animate,
 }: {
   position: [number, number, number]
   rotation: number
   opticalAxisAngle: number
-  no: number
-  ne: number
+  animate: boolean
 }) {
   const crystalRef = useRef<THREE.Group>(null)
+  const invalidate = useThree((s) => s.invalidate)
+  // 角度换算放在帧回调之外，每帧只做一次正弦摆动
+  const rotationRad = (rotation * Math.PI) / 180
 
   useFrame(({ clock }) => {
     if (crystalRef.current) {
-      crystalRef.current.rotation.y = (rotation * Math.PI) / 180 + Math.sin(clock.getElapsedTime() * 0.5) * 0.03
+      // 只有随时间的摆动受动画开关控制，静态转角始终生效
+      const wobble = animate ? Math.sin(clock.getElapsedTime() * 0.5) * 0.03 : 0
+      crystalRef.current.rotation.y = rotationRad + wobble
     }
   })
 
-  // 计算光轴端点（基于光轴角度）
+  // 按需渲染模式下没有连续帧：拖动旋转滑块或切换动画时主动请求一帧
+  useEffect(() => {
+    invalidate()
+  }, [invalidate, rotationRad, animate])
+
+  // 计算光轴端点（基于光轴角度），cos/sin 各只求一次
   const axisLength = 0.8
   const axisRadians = (opticalAxisAngle * Math.PI) / 180
+  const axisX = axisLength * Math.cos(axisRadians)
+  const axisY = axisLength * Math.sin(axisRadians)
   const axisPoints: [[number, number, number], [number, number, number]] = [
-    [-axisLength * Math.cos(axisRadians), -axisLength * Math.sin(axisRadians), 0],
-    [axisLength * Math.cos(axisRadians), axisLength * Math.sin(axisRadians), 0],
+    [-axisX, -axisY, 0],
+    [axisX, axisY, 0],
   ]
 
   return (
@@ -109,7 +244,7 @@ function CalciteCrystal({
           gapSize={0.05}
         />
         {/* 光轴方向箭头 */}
-        <group position={[axisLength * Math.cos(axisRadians), axisLength * Math.sin(axisRadians), 0]} rotation={[0, 0, axisRadians]}>
+        <group position={[axisX, axisY, 0]} rotation={[0, 0, axisRadians]}>
           <mesh>
             <coneGeometry args={[0.06, 0.12, 8]} />
             <meshBasicMaterial color="#fbbf24" />
@@ -117,7 +252,7 @@ function CalciteCrystal({
         </group>
         {/* 光轴标签 */}
         <Text
-          position={[axisLength * 0.6 * Math.cos(axisRadians) + 0.2, axisLength * 0.6 * Math.sin(axisRadians) + 0.15, 0]}
+          position={[axisX * 0.6 + 0.2, axisY * 0.6 + 0.15, 0]}
           fontSize={0.1}
           color="#fbbf24"
         >
@@ -125,15 +260,14 @@ function CalciteCrystal({
         </Text>
       </group>
       {/* 边框 */}
-      <lineSegments>
-        <edgesGeometry args={[new THREE.BoxGeometry(1.5, 1.5, 1)]} />
+      <lineSegments geometry={CRYSTAL_EDGES_GEOMETRY}>
         <lineBasicMaterial color="#22d3ee" transparent opacity={0.8} />
       </lineSegments>
       <Text position={[0, -1.1, 0]} fontSize={0.18} color="#67e8f9">
         方解石晶体
       </Text>
       <Text position={[0, -1.35, 0]} fontSize={0.12} color="#94a3b8">
-        no={no.toFixed(4)} ne={ne.toFixed(4)}
+        {CALCITE_INDEX_LABEL}
       </Text>
     </group>
   )
@@ -156,48 +290,50 @@ function LightBeam({
   const beamRef = useRef<THREE.Group>(null)
   const particlesRef = useRef<THREE.Points>(null)
 
+  // 端点以标量作为依赖：调用方每次渲染都会传入新的数组字面量
+  const [sx, sy, sz] = start
+  const [ex, ey, ez] = end
+
   // 计算方向和长度
-  const direction = useMemo(() => {
-    const dir = new THREE.Vector3(end[0] - start[0], end[1] - start[1], end[2] - start[2])
-    return dir.normalize()
-  }, [start, end])
-
-  const length = useMemo(() => {
-    return Math.sqrt(
-      (end[0] - start[0]) ** 2 +
-      (end[1] - start[1]) ** 2 +
-      (end[2] - start[2]) ** 2
-    )
-  }, [start, end])
+  const { direction, length } = useMemo(() => {
+    const dir = new THREE.Vector3(ex - sx, ey - sy, ez - sz)
+    const len = dir.length()
+    return { direction: dir.normalize(), length: len }
+  }, [sx, sy, sz, ex, ey, ez])
+
+  // 粒子初始位置（仅在光束几何变化时重建）
+  const particlePositions = useMemo(() => {
+    const positions = new Float32Array(30)
+    for (let i = 0; i < 10; i++) {
+      const progress = i / 10
+      positions[i * 3] = sx + direction.x * length * progress
+      positions[i * 3 + 1] = sy + direction.y * length * progress
+      positions[i * 3 + 2] = sz + direction.z * length * progress
+    }
+    return positions
+  }, [sx, sy, sz, direction, length])
+
+  // 强度过低时隐藏光束而非卸载，避免反复重建线条与粒子几何体
+  const visible = intensity >= 0.05
 
   // 粒子动画
   useFrame(({ clock }) => {
-    if (particlesRef.current && animate) {
+    if (particlesRef.current && animate && visible) {
       const positions = particlesRef.current.geometry.attributes.position.array as Float32Array
       const time = clock.getElapsedTime()
 
       for (let i = 0; i < 10; i++) {
         const progress = ((i / 10 + time * 0.5) % 1)
-        positions[i * 3] = start[0] + direction.x * length * progress
-        positions[i * 3 + 1] = start[1] + direction.y * length * progress
-        positions[i * 3 + 2] = start[2] + direction.z * length * progress
+        positions[i * 3] = sx + direction.x * length * progress
+        positions[i * 3 + 1] = sy + direction.y * length * progress
+        positions[i * 3 + 2] = sz + direction.z * length * progress
       }
       particlesRef.current.geometry.attributes.position.needsUpdate = true
     }
   })
 
-  if (intensity < 0.05) return null
-
-  const particlePositions = new Float32Array(30)
-  for (let i = 0; i < 10; i++) {
-    const progress = i / 10
-    particlePositions[i * 3] = start[0] + direction.x * length * progress
-    particlePositions[i * 3 + 1] = start[1] + direction.y * length * progress
-    particlePositions[i * 3 + 2] = start[2] + direction.z * length * progress
-  }
-
   return (
-    <group ref={beamRef}>
+    <group ref={beamRef} visible={visible}>
       {/* 主光束线 */}
       <Line
         points={[start, end]}
@@ -306,40 +442,16 @@ function BirefringenceScene({
   crystalRotation,
   envRefractiveIndex,
   opticalAxisAngle,
-  no,
-  ne,
+  state,
 }: {
   inputPolarization: number
   animate: boolean
   crystalRotation: number
   envRefractiveIndex: number
   opticalAxisAngle: number
-  no: number
-  ne: number
+  state: BirefringenceState
 }) {
-  // 计算有效的偏振角度（相对于光轴方向）
-  const effectivePolarization = inputPolarization - opticalAxisAngle
-  const radians = (effectivePolarization * Math.PI) / 180
-  // o光强度 = cos²θ（马吕斯定律）
-  const oIntensity = Math.pow(Math.cos(radians), 2)
-  // e光强度 = sin²θ（与o光互补，总和为1）
-  const eIntensity = Math.pow(Math.sin(radians), 2)
-
-  // 计算折射导致的光束偏移（基于斯涅尔定律）
-  // 双折射率差（有效值，取决于光轴角度）
-  const birefringence = Math.abs(no - ne)
-  // 环境折射率对光束分离的影响因子
-  const separationFactor = birefringence / envRefractiveIndex
-
-  // o光和e光的分离角度（基于光轴方向）
-  const axisRad = (opticalAxisAngle * Math.PI) / 180
-  const baseSeparation = 0.5 * (1 + separationFactor * 2)
-
-  // o光向垂直于光轴方向偏折，e光沿光轴方向偏折
-  const oOffsetY = baseSeparation * Math.cos(axisRad)
-  const oOffsetZ = baseSeparation * Math.sin(axisRad) * 0.3
-  const eOffsetY = -baseSeparation * Math.cos(axisRad)
-  const eOffsetZ = -baseSeparation * Math.sin(axisRad) * 0.3
+  const { oIntensity, eIntensity, oOffsetY, oOffsetZ, eOffsetY, eOffsetZ } = state
 
   return (
     <>
@@ -348,7 +460,7 @@ function BirefringenceScene({
       <pointLight position={[-5, -5, -5]} intensity={0.3} color="#4ade80" />
 
       {/* 光源 */}
-      <LightSource position={[-4, 0, 0]} />
+      <LightSource position={[-4, 0, 0]} animate={animate} />
 
       {/* 入射光束 */}
       <LightBeam
@@ -380,8 +492,7 @@ function BirefringenceScene({
         position={[0, 0, 0]}
         rotation={crystalRotation}
         opticalAxisAngle={opticalAxisAngle}
-        no={no}
-        ne={ne}
+        animate={animate}
       />
 
       {/* o光出射 (偏折方向取决于光轴) */}
@@ -490,6 +601,13 @@ function TabButton({
   )
 }
 
+// 入射偏振预设
+const POLARIZATION_PRESETS = [
+  { label: '0° (纯o光)', value: 0 },
+  { label: '45° (等分)', value: 45 },
+  { label: '90° (纯e光)', value: 90 },
+]
+
 // 环境介质预设
 const ENV_PRESETS = [
   { label: '空气', labelEn: 'Air', value: 1.0 },
@@ -498,6 +616,12 @@ const ENV_PRESETS = [
   { label: '油浸', labelEn: 'Oil', value: 1.52 },
 ]
 
+// 画布配置：相机与渲染器参数只在创建时读取一次，画布高度固定，不随页面滚动重新测量
+const CANVAS_CAMERA = { position: [0, 2, 8] as [number, number, number], fov: 50 }
+const CANVAS_GL = { antialias: true }
+const CANVAS_DPR: [number, number] = [1, 2]
+const CANVAS_RESIZE = { scroll: false }
+
 // 主演示组件
 export function BirefringenceDemo() {
   const { i18n } = useTranslation()
@@ -512,26 +636,12 @@ export function BirefringenceDemo() {
   const [envRefractiveIndex, setEnvRefractiveIndex] = useState(1.0) // 环境折射率
   const [opticalAxisAngle, setOpticalAxisAngle] = useState(45) // 光轴方向角度
 
-  // 方解石折射率（标准值，可作为常量或可调参数）
-  const no = 1.6584 // o光折射率
-  const ne = 1.4864 // e光折射率
-
-  // 计算有效偏振角度（相对于光轴）
-  const effectivePolarization = inputPolarization - opticalAxisAngle
-  const radians = (effectivePolarization * Math.PI) / 180
-  const oIntensity = Math.pow(Math.cos(radians), 2)
-  const eIntensity = Math.pow(Math.sin(radians), 2)
-
-  // 计算双折射率差和光束分离
-  const birefringence = Math.abs(no - ne)
-  const separationFactor = birefringence / envRefractiveIndex
-
-  // 预设选项
-  const presets = [
-    { label: '0° (纯o光)', value: 0 },
-    { label: '45° (等分)', value: 45 },
-    { label: '90° (纯e光)', value: 90 },
-  ]
+  // 派生状态只在控制参数变化时重算一次（动画开关、晶体旋转不影响它）
+  const state = useMemo(
+    () => computeBirefringenceState(inputPolarization, opticalAxisAngle, envRefractiveIndex),
+    [inputPolarization, opticalAxisAngle, envRefractiveIndex]
+  )
+  const { effectivePolarization, oIntensity, eIntensity, oText, eText, separationFactor } = state
 
   return (
     <div className="flex flex-col gap-6 h-full">
@@ -577,9 +687,13 @@ export function BirefringenceDemo() {
           >
             {/* 3D可视化面板 */}
             <div className="bg-slate-900/50 rounded-xl border border-cyan-400/20 overflow-hidden" style={{ height: 400 }}>
+              {/* 动画暂停时按需渲染：只有参数变化或视角拖动时才重绘一帧 */}
               <Canvas
-                camera={{ position: [0, 2, 8], fov: 50 }}
-                gl={{ antialias: true, pixelRatio: Math.min(window.devicePixelRatio, 2) }}
+                camera={CANVAS_CAMERA}
+                gl={CANVAS_GL}
+                dpr={CANVAS_DPR}
+                resize={CANVAS_RESIZE}
+                frameloop={animate ? 'always' : 'demand'}
               >
                 <BirefringenceScene
                   inputPolarization={inputPolarization}
@@ -587,8 +701,7 @@ export function BirefringenceDemo() {
                   crystalRotation={crystalRotation}
                   envRefractiveIndex={envRefractiveIndex}
                   opticalAxisAngle={opticalAxisAngle}
-                  no={no}
-                  ne={ne}
+                  state={state}
                 />
               </Canvas>
             </div>
@@ -608,7 +721,7 @@ export function BirefringenceDemo() {
                   color="orange"
                 />
                 <div className="flex flex-wrap gap-2">
-                  {presets.map((preset) => (
+                  {POLARIZATION_PRESETS.map((preset) => (
                     <PresetButton
                       key={preset.value}
                       label={preset.label}
@@ -656,7 +769,7 @@ export function BirefringenceDemo() {
                 <div className="text-xs text-gray-400 mt-1">
                   <span>{isZh ? '有效偏振角 (θ): ' : 'Effective θ: '}</span>
                   <span className="text-yellow-400 font-mono">
-                    {((inputPolarization - opticalAxisAngle + 180) % 180).toFixed(0)}°
+                    {normalizeDeg180(effectivePolarization).toFixed(0)}°
                   </span>
                 </div>
               </ControlPanel>
@@ -695,7 +808,7 @@ export function BirefringenceDemo() {
               <ControlPanel title={isZh ? "分量强度" : "Intensity"}>
                 <ValueDisplay
                   label={isZh ? "o光强度 (cos²θ)" : "o-ray (cos²θ)"}
-                  value={(oIntensity * 100).toFixed(1)}
+                  value={oText}
                   unit="%"
                   color="red"
                 />
@@ -708,7 +821,7 @@ export function BirefringenceDemo() {
                 </div>
                 <ValueDisplay
                   label={isZh ? "e光强度 (sin²θ)" : "e-ray (sin²θ)"}
-                  value={(eIntensity * 100).toFixed(1)}
+                  value={eText}
                   unit="%"
                   color="green"
                 />
@@ -730,15 +843,15 @@ export function BirefringenceDemo() {
                   <div className="space-y-2">
                     <div className="flex justify-between">
                       <span>{isZh ? 'o光折射率' : 'o-ray index'} (no):</span>
-                      <span className="text-cyan-400 font-mono">{no.toFixed(4)}</span>
+                      <span className="text-cyan-400 font-mono">{CALCITE_NO.toFixed(4)}</span>
                     </div>
                     <div className="flex justify-between">
                       <span>{isZh ? 'e光折射率' : 'e-ray index'} (ne):</span>
-                      <span className="text-cyan-400 font-mono">{ne.toFixed(4)}</span>
+                      <span className="text-cyan-400 font-mono">{CALCITE_NE.toFixed(4)}</span>
                     </div>
                     <div className="flex justify-between">
                       <span>{isZh ? '双折射率差' : 'Birefringence'} (Δn):</span>
-                      <span className="text-purple-400 font-mono">{birefringence.toFixed(4)}</span>
+                      <span className="text-purple-400 font-mono">{CALCITE_BIREFRINGENCE.toFixed(4)}</span>
                     </div>
                   </div>
                   <div className="space-y-2">
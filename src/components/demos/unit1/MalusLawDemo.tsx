@@ -8,7 +8,7 @@
  * - application: 完整显示所有内容
  * - research: 添加消光比参数模拟非理想偏振片
  */
-import { useState, useEffect, useMemo, useRef, useCallback } from 'react'
+import { useState, useEffect, useRef, useCallback, memo } from 'react'
 import { motion } from 'framer-motion'
 import { useTranslation } from 'react-i18next'
 import { SliderControl, ControlPanel, InfoCard } from '../DemoControls'
@@ -266,25 +266,22 @@ function PolarizerCircle({
   )
 }
 
-// SVG 曲线图组件
-function MalusCurveChart({ currentAngle, intensity }: { currentAngle: number; intensity: number }) {
-  // 生成 cos² 曲线路径
-  const curvePath = useMemo(() => {
-    const points: string[] = []
-    for (let theta = 0; theta <= 180; theta += 2) {
-      const x = 25 + (theta / 180) * 180
-      const y = 95 - Math.pow(Math.cos((theta * Math.PI) / 180), 2) * 70
-      points.push(`${theta === 0 ? 'M' : 'L'} ${x},${y}`)
-    }
-    return points.join(' ')
-  }, [])
-
-  // 当前点位置
-  const pointX = 25 + (currentAngle / 180) * 180
-  const pointY = 95 - intensity * 70
+// cos² 曲线路径与参数无关，模块加载时生成一次（0°-180°，步长2°）
+const MALUS_CURVE_PATH = (() => {
+  const points: string[] = []
+  for (let theta = 0; theta <= 180; theta += 2) {
+    const c = Math.cos((theta * Math.PI) / 180)
+    const x = 25 + (theta / 180) * 180
+    const y = 95 - c * c * 70
+    points.push(`${theta === 0 ? 'M' : 'L'} ${x},${y}`)
+  }
+  return points.join(' ')
+})()
 
+// 曲线图静态层（坐标轴、网格、刻度、cos² 曲线）：与当前角度无关，只渲染一次
+const MalusChartBackground = memo(function MalusChartBackground() {
   return (
-    <svg viewBox="0 0 230 120" className="w-full h-auto">
+    <>
       {/* 坐标轴 */}
       <line x1="25" y1="95" x2="210" y2="95" stroke="#d1dcff" strokeWidth="1" />
       <line x1="25" y1="95" x2="25" y2="20" stroke="#d1dcff" strokeWidth="1" />
@@ -320,7 +317,42 @@ function MalusCurveChart({ currentAngle, intensity }: { currentAngle: number; in
       })}
 
       {/* 曲线 */}
-      <path d={curvePath} fill="none" stroke="#4f9ef7" strokeWidth="2" />
+      <path d={MALUS_CURVE_PATH} fill="none" stroke="#4f9ef7" strokeWidth="2" />
+    </>
+  )
+})
+
+// 轴标题：绘制在当前点之上，同样只渲染一次
+const MalusChartTitles = memo(function MalusChartTitles() {
+  return (
+    <>
+      {/* 轴标题 */}
+      <text x="118" y="118" textAnchor="middle" fill="#f0f3ff" fontSize="9">
+        θ
+      </text>
+      <text
+        x="8"
+        y="58"
+        textAnchor="middle"
+        fill="#f0f3ff"
+        fontSize="9"
+        transform="rotate(-90 8 58)"
+      >
+        I / I₀
+      </text>
+    </>
+  )
+})
+
+// SVG 曲线图组件
+function MalusCurveChart({ currentAngle, intensity }: { currentAngle: number; intensity: number }) {
+  // 当前点位置
+  const pointX = 25 + (currentAngle / 180) * 180
+  const pointY = 95 - intensity * 70
+
+  return (
+    <svg viewBox="0 0 230 120" className="w-full h-auto">
+      <MalusChartBackground />
 
       {/* 当前点 */}
       <motion.circle
@@ -352,20 +384,7 @@ function MalusCurveChart({ currentAngle, intensity }: { currentAngle: number; in
         θ={currentAngle.toFixed(0)}°, I/I₀≈{intensity.toFixed(2)}
       </motion.text>
 
-      {/* 轴标题 */}
-      <text x="118" y="118" textAnchor="middle" fill="#f0f3ff" fontSize="9">
-        θ
-      </text>
-      <text
-        x="8"
-        y="58"
-        textAnchor="middle"
-        fill="#f0f3ff"
-        fontSize="9"
-        transform="rotate(-90 8 58)"
-      >
-        I / I₀
-      </text>
+      <MalusChartTitles />
     </svg>
   )
 }
@@ -391,6 +410,7 @@ export function MalusLawDemo({ difficultyLevel = 'application' }: MalusLawDemoPr
   // 对于研究级别,考虑消光比的影响
   // 非理想偏振片: I = I₀ × [cos²θ + sin²θ/ER] 其中 ER 是消光比
   const sin2Theta = 1 - cos2Theta
+  // 透射率 I/I₀：效率显示与曲线标记直接使用，不再由 I 除回 I₀
   const imperfectFactor = isResearch ? (cos2Theta + sin2Theta / extinctionRatio) : cos2Theta
   const transmittedIntensity = incidentIntensity * imperfectFactor
 
@@ -631,7 +651,7 @@ export function MalusLawDemo({ difficultyLevel = 'application' }: MalusLawDemoPr
                 </div>
                 <div className="col-span-2 text-gray-400">
                   I/I₀ ≈{' '}
-                  <span className="text-orange-400 font-mono font-semibold">{(transmittedIntensity / incidentIntensity).toFixed(4)}</span>
+                  <span className="text-orange-400 font-mono font-semibold">{imperfectFactor.toFixed(4)}</span>
                   {isResearch && Math.abs(angle - 90) < 5 && (
                     <span className="text-yellow-400 ml-2 text-xs">
                       (泄漏: {((1 / extinctionRatio) * 100).toFixed(2)}%)
@@ -672,7 +692,7 @@ export function MalusLawDemo({ difficultyLevel = 'application' }: MalusLawDemoPr
                 </div>
                 <div className="mt-2 text-center">
                   <span className="text-2xl font-bold text-orange-400">
-                    {(transmittedIntensity * 100).toFixed(0)}%
+                    {(imperfectFactor * 100).toFixed(0)}%
                   </span>
                   <span className="text-gray-400 text-sm ml-2">的光通过</span>
                 </div>
@@ -683,7 +703,7 @@ export function MalusLawDemo({ difficultyLevel = 'application' }: MalusLawDemoPr
           {/* 曲线图 - 基础难度隐藏 */}
           {!isFoundation && (
             <ControlPanel title={t('demoUi.malus.curveTitle')}>
-              <MalusCurveChart currentAngle={angle} intensity={isResearch ? transmittedIntensity / incidentIntensity : cos2Theta} />
+              <MalusCurveChart currentAngle={angle} intensity={imperfectFactor} />
               <p className="text-xs text-gray-400 mt-2">
                 {t('demoUi.malus.curveDesc')}
                 {isResearch && ' 注意: 非理想偏振片在90°处仍有微小透射。'}
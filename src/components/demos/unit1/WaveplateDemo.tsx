@@ -44,6 +44,170 @@ interface WaveplateParams extends NonIdealWaveplateParams {
   useNonIdeal: boolean
 }
 
+// 光路演示画布尺寸与元件位置
+const SCENE_WIDTH = 700
+const SCENE_HEIGHT = 300
+const SCENE_CENTER_Y = SCENE_HEIGHT / 2
+const SOURCE_X = 50
+const WAVEPLATE_X = 280
+const WAVEPLATE_WIDTH = 80
+const SCREEN_X = 650
+// 偏振态指示器尺寸及其下方标签的纵向偏移
+const INDICATOR_SIZE = 20
+const LABEL_OFFSET_Y = 40
+
+// 输出偏振态
+type OutputState = { type: PolarizationState; angle: number }
+
+// 计算输出偏振态
+// 圆偏振旋向约定（物理学惯例）：
+// - 右旋(RCP)：从光源方向看，电场矢量顺时针旋转
+// - 左旋(LCP)：从光源方向看，电场矢量逆时针旋转
+// 当线偏振光入射λ/4波片，相对快轴角度为+45°时产生右旋圆偏振，-45°(即135°)时产生左旋圆偏振
+function getOutputState(waveplateType: WaveplateType, inputAngle: number, fastAxisAngle: number): OutputState {
+  const relativeAngle = ((inputAngle - fastAxisAngle) % 180 + 180) % 180
+
+  if (waveplateType === 'quarter') {
+    // 相对角度45°→右旋圆偏振，135°→左旋圆偏振
+    if (Math.abs(relativeAngle - 45) < 5) {
+      return { type: 'circular-r', angle: 0 }  // 右旋
+    } else if (Math.abs(relativeAngle - 135) < 5) {
+      return { type: 'circular-l', angle: 0 }  // 左旋
+    } else if (relativeAngle < 5 || Math.abs(relativeAngle - 90) < 5 || Math.abs(relativeAngle - 180) < 5) {
+      return { type: 'linear', angle: inputAngle }
+    } else {
+      return { type: 'elliptical', angle: inputAngle }
+    }
+  } else {
+    // λ/2波片：输出角度 = 2×快轴角度 - 输入角度
+    const outputAngle = ((2 * fastAxisAngle - inputAngle) % 180 + 180) % 180
+    return { type: 'linear', angle: outputAngle }
+  }
+}
+
+// 输出光束颜色
+function getOutputColor(type: PolarizationState): string {
+  return type === 'circular-r' || type === 'circular-l'
+    ? '#22d3ee'
+    : type === 'elliptical'
+      ? '#a78bfa'
+      : '#44ff44'
+}
+
+// 静态背景层：光源、光束主线、波片、屏幕与文字只随参数变化，
+// 画到离屏画布后，动画帧内整体贴图，只重绘粒子、偏振指示器与光斑
+// 指示器最大半径约为 INDICATOR_SIZE + 8（圆偏振旋向箭头），小于到文字顶端的距离
+// （LABEL_OFFSET_Y - 10px 字号），所以叠在文字层之上也不会遮挡标签
+function renderWaveplateScene(
+  waveplateType: WaveplateType,
+  inputAngle: number,
+  fastAxisAngle: number,
+  dpr: number
+): HTMLCanvasElement | null {
+  const width = SCENE_WIDTH
+  const height = SCENE_HEIGHT
+  const centerY = SCENE_CENTER_Y
+  const sourceX = SOURCE_X
+  const waveplateX = WAVEPLATE_X
+  const waveplateWidth = WAVEPLATE_WIDTH
+  const screenX = SCREEN_X
+
+  const outputState = getOutputState(waveplateType, inputAngle, fastAxisAngle)
+  const outputColor = getOutputColor(outputState.type)
+  const outputLabel = outputState.type === 'linear'
+    ? `输出: ${outputState.angle.toFixed(0)}°`
+    : outputState.type === 'circular-r'
+      ? '右旋圆偏振'
+      : outputState.type === 'circular-l'
+        ? '左旋圆偏振'
+        : '椭圆偏振'
+
+  const background = document.createElement('canvas')
+  background.width = width * dpr
+  background.height = height * dpr
+  const bg = background.getContext('2d')
+  if (!bg) return null
+  bg.scale(dpr, dpr)
+
+  bg.fillStyle = '#0f172a'
+  bg.fillRect(0, 0, width, height)
+
+  // 绘制光源
+  const gradient = bg.createRadialGradient(sourceX, centerY, 0, sourceX, centerY, 25)
+  gradient.addColorStop(0, 'rgba(251, 191, 36, 1)')
+  gradient.addColorStop(1, 'rgba(251, 191, 36, 0)')
+  bg.beginPath()
+  bg.fillStyle = gradient
+  bg.arc(sourceX, centerY, 25, 0, Math.PI * 2)
+  bg.fill()
+
+  bg.fillStyle = '#fbbf24'
+  bg.beginPath()
+  bg.arc(sourceX, centerY, 12, 0, Math.PI * 2)
+  bg.fill()
+
+  bg.fillStyle = '#94a3b8'
+  bg.font = '11px sans-serif'
+  bg.textAlign = 'center'
+  bg.fillText('线偏振光源', sourceX, centerY + 50)
+
+  // 入射光束主线
+  drawBeamLine(bg, sourceX + 20, centerY, waveplateX - 10, centerY, '#ffaa00', 1)
+
+  bg.fillStyle = '#ffaa00'
+  bg.font = '10px sans-serif'
+  bg.fillText(`输入: ${inputAngle}°`, 150, centerY + LABEL_OFFSET_Y)
+
+  // 绘制波片
+  drawWaveplate(bg, waveplateX, centerY - 60, waveplateWidth, 120, fastAxisAngle, waveplateType)
+
+  // 输出光束主线
+  drawBeamLine(bg, waveplateX + waveplateWidth + 10, centerY, screenX - 20, centerY, outputColor, 1)
+
+  bg.fillStyle = outputColor
+  bg.font = '10px sans-serif'
+  bg.fillText(outputLabel, 500, centerY + LABEL_OFFSET_Y)
+
+  // 绘制屏幕
+  bg.fillStyle = '#1e293b'
+  bg.fillRect(screenX - 5, centerY - 80, 20, 160)
+
+  bg.fillStyle = '#94a3b8'
+  bg.fillText('观察屏', screenX, centerY + 100)
+
+  return background
+}
+
+// 背景层缓存：滑块步长5°，配置空间有限，来回拖动或切换预设/动画开关时直接复用
+// 每张背景是整幅位图（DPR 2 时约 3.4MB），只保留最近使用的 3 张（LRU，利用 Map 的插入顺序），
+// 演示卸载时清空
+const SCENE_CACHE_SIZE = 3
+const sceneCache = new Map<string, HTMLCanvasElement>()
+
+function getWaveplateScene(
+  waveplateType: WaveplateType,
+  inputAngle: number,
+  fastAxisAngle: number,
+  dpr: number
+): HTMLCanvasElement | null {
+  const key = `${waveplateType}|${inputAngle}|${fastAxisAngle}|${dpr}`
+  const cached = sceneCache.get(key)
+  if (cached) {
+    sceneCache.delete(key)
+    sceneCache.set(key, cached)
+    return cached
+  }
+
+  const scene = renderWaveplateScene(waveplateType, inputAngle, fastAxisAngle, dpr)
+  if (!scene) return null
+  if (sceneCache.size >= SCENE_CACHE_SIZE) {
+    const oldest = sceneCache.keys().next().value
+    if (oldest !== undefined) sceneCache.delete(oldest)
+  }
+  sceneCache.set(key, scene)
+  return scene
+}
+
 // 波片光路演示Canvas
 function WaveplateCanvas({
   waveplateType,
@@ -60,31 +224,13 @@ function WaveplateCanvas({
   const timeRef = useRef(0)
   const animationRef = useRef<number | undefined>(undefined)
 
-  // 计算输出偏振态
-  // 圆偏振旋向约定（物理学惯例）：
-  // - 右旋(RCP)：从光源方向看，电场矢量顺时针旋转
-  // - 左旋(LCP)：从光源方向看，电场矢量逆时针旋转
-  // 当线偏振光入射λ/4波片，相对快轴角度为+45°时产生右旋圆偏振，-45°(即135°)时产生左旋圆偏振
-  const outputState = useMemo(() => {
-    const relativeAngle = ((inputAngle - fastAxisAngle) % 180 + 180) % 180
+  const outputState = useMemo(
+    () => getOutputState(waveplateType, inputAngle, fastAxisAngle),
+    [waveplateType, inputAngle, fastAxisAngle]
+  )
 
-    if (waveplateType === 'quarter') {
-      // 相对角度45°→右旋圆偏振，135°→左旋圆偏振
-      if (Math.abs(relativeAngle - 45) < 5) {
-        return { type: 'circular-r' as PolarizationState, angle: 0 }  // 右旋
-      } else if (Math.abs(relativeAngle - 135) < 5) {
-        return { type: 'circular-l' as PolarizationState, angle: 0 }  // 左旋
-      } else if (relativeAngle < 5 || Math.abs(relativeAngle - 90) < 5 || Math.abs(relativeAngle - 180) < 5) {
-        return { type: 'linear' as PolarizationState, angle: inputAngle }
-      } else {
-        return { type: 'elliptical' as PolarizationState, angle: inputAngle }
-      }
-    } else {
-      // λ/2波片：输出角度 = 2×快轴角度 - 输入角度
-      const outputAngle = ((2 * fastAxisAngle - inputAngle) % 180 + 180) % 180
-      return { type: 'linear' as PolarizationState, angle: outputAngle }
-    }
-  }, [waveplateType, inputAngle, fastAxisAngle])
+  // 离开演示后释放缓存的背景位图
+  useEffect(() => () => sceneCache.clear(), [])
 
   useEffect(() => {
     const canvas = canvasRef.current
@@ -93,8 +239,8 @@ function WaveplateCanvas({
     const ctx = canvas.getContext('2d')
     if (!ctx) return
 
-    const width = 700
-    const height = 300
+    const width = SCENE_WIDTH
+    const height = SCENE_HEIGHT
     const dpr = window.devicePixelRatio || 1
     canvas.width = width * dpr
     canvas.height = height * dpr
@@ -102,88 +248,33 @@ function WaveplateCanvas({
     canvas.style.height = `${height}px`
     ctx.scale(dpr, dpr)
 
-    const centerY = height / 2
-    const sourceX = 50
-    const waveplateX = 280
-    const waveplateWidth = 80
-    const screenX = 650
+    const background = getWaveplateScene(waveplateType, inputAngle, fastAxisAngle, dpr)
+    if (!background) return
+
+    const centerY = SCENE_CENTER_Y
+    const outputColor = getOutputColor(outputState.type)
 
     const draw = () => {
-      // 清除画布
-      ctx.fillStyle = '#0f172a'
-      ctx.fillRect(0, 0, width, height)
+      ctx.drawImage(background, 0, 0, width, height)
 
       const t = timeRef.current * 0.05
 
-      // 绘制光源
-      const gradient = ctx.createRadialGradient(sourceX, centerY, 0, sourceX, centerY, 25)
-      gradient.addColorStop(0, 'rgba(251, 191, 36, 1)')
-      gradient.addColorStop(1, 'rgba(251, 191, 36, 0)')
-      ctx.beginPath()
-      ctx.fillStyle = gradient
-      ctx.arc(sourceX, centerY, 25, 0, Math.PI * 2)
-      ctx.fill()
-
-      ctx.fillStyle = '#fbbf24'
-      ctx.beginPath()
-      ctx.arc(sourceX, centerY, 12, 0, Math.PI * 2)
-      ctx.fill()
-
-      ctx.fillStyle = '#94a3b8'
-      ctx.font = '11px sans-serif'
-      ctx.textAlign = 'center'
-      ctx.fillText('线偏振光源', sourceX, centerY + 50)
-
-      // 入射光束（带偏振方向指示）
-      drawAnimatedBeam(ctx, sourceX + 20, centerY, waveplateX - 10, centerY, '#ffaa00', 1, t)
-
-      // 入射偏振态指示
-      drawPolarizationIndicator(ctx, 150, centerY, inputAngle, 'linear', '#ffaa00', t)
-      ctx.fillStyle = '#ffaa00'
-      ctx.font = '10px sans-serif'
-      ctx.fillText(`输入: ${inputAngle}°`, 150, centerY + 40)
-
-      // 绘制波片
-      drawWaveplate(ctx, waveplateX, centerY - 60, waveplateWidth, 120, fastAxisAngle, waveplateType)
-
-      // 输出光束
-      const outputColor = outputState.type === 'circular-r' || outputState.type === 'circular-l'
-        ? '#22d3ee'
-        : outputState.type === 'elliptical'
-          ? '#a78bfa'
-          : '#44ff44'
+      // 光束粒子
+      drawBeamParticles(ctx, SOURCE_X + 20, centerY, WAVEPLATE_X - 10, centerY, '#ffaa00', t)
+      drawBeamParticles(ctx, WAVEPLATE_X + WAVEPLATE_WIDTH + 10, centerY, SCREEN_X - 20, centerY, outputColor, t)
 
-      drawAnimatedBeam(ctx, waveplateX + waveplateWidth + 10, centerY, screenX - 20, centerY, outputColor, 1, t)
-
-      // 输出偏振态指示
+      // 入射、输出偏振态指示
+      drawPolarizationIndicator(ctx, 150, centerY, inputAngle, 'linear', '#ffaa00', t)
       drawPolarizationIndicator(ctx, 500, centerY, outputState.angle, outputState.type, outputColor, t)
 
-      const outputLabel = outputState.type === 'linear'
-        ? `输出: ${outputState.angle.toFixed(0)}°`
-        : outputState.type === 'circular-r'
-          ? '右旋圆偏振'
-          : outputState.type === 'circular-l'
-            ? '左旋圆偏振'
-            : '椭圆偏振'
-
-      ctx.fillStyle = outputColor
-      ctx.font = '10px sans-serif'
-      ctx.fillText(outputLabel, 500, centerY + 40)
-
-      // 绘制屏幕
-      ctx.fillStyle = '#1e293b'
-      ctx.fillRect(screenX - 5, centerY - 80, 20, 160)
-
-      // 屏幕上的光斑
-      drawScreenSpot(ctx, screenX, centerY, outputState.type, outputColor, t)
-
-      ctx.fillStyle = '#94a3b8'
-      ctx.fillText('观察屏', screenX, centerY + 100)
+      // 屏幕上的光斑：光晕与输出光束末端重叠，保持原有层次画在粒子之上
+      drawScreenSpot(ctx, SCREEN_X, centerY, outputState.type, outputColor, t)
 
+      // 不播放动画时画面静止，画完一帧即可
       if (animate) {
         timeRef.current += 1
+        animationRef.current = requestAnimationFrame(draw)
       }
-      animationRef.current = requestAnimationFrame(draw)
     }
 
     draw()
@@ -204,22 +295,16 @@ function WaveplateCanvas({
   )
 }
 
-// 绘制动画光束
-function drawAnimatedBeam(
+// 绘制光束主线（静态层）
+function drawBeamLine(
   ctx: CanvasRenderingContext2D,
   x1: number,
   y1: number,
   x2: number,
   y2: number,
   color: string,
-  intensity: number,
-  time: number
+  intensity: number
 ) {
-  const length = Math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-  const particleSpacing = 25
-  const numParticles = Math.floor(length / particleSpacing)
-
-  // 主光束线
   ctx.beginPath()
   ctx.strokeStyle = color
   ctx.globalAlpha = 0.4 + intensity * 0.3
@@ -228,20 +313,34 @@ function drawAnimatedBeam(
   ctx.lineTo(x2, y2)
   ctx.stroke()
   ctx.globalAlpha = 1
+}
+
+// 绘制光束上的动画粒子
+function drawBeamParticles(
+  ctx: CanvasRenderingContext2D,
+  x1: number,
+  y1: number,
+  x2: number,
+  y2: number,
+  color: string,
+  time: number
+) {
+  const length = Math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+  const particleSpacing = 25
+  const numParticles = Math.floor(length / particleSpacing)
 
-  // 动画粒子
+  ctx.fillStyle = color
+  ctx.globalAlpha = 0.7
   for (let i = 0; i < numParticles; i++) {
     const progress = ((i * particleSpacing + time * 4) % length) / length
     const px = x1 + (x2 - x1) * progress
     const py = y1 + (y2 - y1) * progress
 
     ctx.beginPath()
-    ctx.fillStyle = color
-    ctx.globalAlpha = 0.7
     ctx.arc(px, py, 2.5, 0, Math.PI * 2)
     ctx.fill()
-    ctx.globalAlpha = 1
   }
+  ctx.globalAlpha = 1
 }
 
 // 绘制波片
@@ -331,7 +430,7 @@ function drawPolarizationIndicator(
   color: string,
   time: number
 ) {
-  const size = 20
+  const size = INDICATOR_SIZE
 
   ctx.save()
   ctx.translate(x, y)
@@ -438,6 +537,38 @@ function drawScreenSpot(
   ctx.globalAlpha = 1
 }
 
+// 相位延迟图尺寸与波形参数
+const PHASE_DIAGRAM_WIDTH = 280
+const PHASE_DIAGRAM_HEIGHT = 140
+const PHASE_WAVELENGTH = 60
+const PHASE_AMPLITUDE = 35
+
+// 逐像素计算曲线纵坐标；曲线与滑块无关，慢轴只取决于波片类型，模块加载时全部算好
+function phaseCurveY(sign: number, phase: number): Float64Array {
+  const centerY = PHASE_DIAGRAM_HEIGHT / 2
+  const ys = new Float64Array(PHASE_DIAGRAM_WIDTH)
+  for (let x = 0; x < PHASE_DIAGRAM_WIDTH; x++) {
+    ys[x] = centerY + sign * PHASE_AMPLITUDE * Math.sin((2 * Math.PI * x) / PHASE_WAVELENGTH + phase)
+  }
+  return ys
+}
+
+const PHASE_FAST_Y = phaseCurveY(1, 0)
+const PHASE_SLOW_Y: Record<WaveplateType, Float64Array> = {
+  quarter: phaseCurveY(-1, Math.PI / 2),
+  half: phaseCurveY(-1, Math.PI),
+}
+
+// 沿 x 逐像素连线绘制预计算曲线
+function strokeCurve(ctx: CanvasRenderingContext2D, ys: Float64Array) {
+  ctx.beginPath()
+  ctx.moveTo(0, ys[0])
+  for (let x = 1; x < ys.length; x++) {
+    ctx.lineTo(x, ys[x])
+  }
+  ctx.stroke()
+}
+
 // 相位延迟图
 function PhaseRetardationDiagram({
   waveplateType,
@@ -453,8 +584,8 @@ function PhaseRetardationDiagram({
     const ctx = canvas.getContext('2d')
     if (!ctx) return
 
-    const width = 280
-    const height = 140
+    const width = PHASE_DIAGRAM_WIDTH
+    const height = PHASE_DIAGRAM_HEIGHT
     const dpr = window.devicePixelRatio || 1
     canvas.width = width * dpr
     canvas.height = height * dpr
@@ -466,32 +597,15 @@ function PhaseRetardationDiagram({
     ctx.fillStyle = '#1e293b'
     ctx.fillRect(0, 0, width, height)
 
-    const centerY = height / 2
-    const wavelength = 60
-    const amplitude = 35
-    const phase = waveplateType === 'quarter' ? Math.PI / 2 : Math.PI
-
     // 快轴分量（黄色）
     ctx.strokeStyle = '#fbbf24'
     ctx.lineWidth = 2
-    ctx.beginPath()
-    for (let x = 0; x < width; x++) {
-      const y = centerY + amplitude * Math.sin((2 * Math.PI * x) / wavelength)
-      if (x === 0) ctx.moveTo(x, y)
-      else ctx.lineTo(x, y)
-    }
-    ctx.stroke()
+    strokeCurve(ctx, PHASE_FAST_Y)
 
     // 慢轴分量（蓝色，带相位延迟）
     ctx.strokeStyle = '#60a5fa'
     ctx.lineWidth = 2
-    ctx.beginPath()
-    for (let x = 0; x < width; x++) {
-      const y = centerY - amplitude * Math.sin((2 * Math.PI * x) / wavelength + phase)
-      if (x === 0) ctx.moveTo(x, y)
-      else ctx.lineTo(x, y)
-    }
-    ctx.stroke()
+    strokeCurve(ctx, PHASE_SLOW_Y[waveplateType])
 
     // 相位差标注
     ctx.fillStyle = '#fbbf24'
@@ -8,7 +8,7 @@
  * - 展示不同波长下布儒斯特角的变化
  * - 波长滑块和光谱色彩显示
  */
-import { useState, useMemo } from 'react'
+import { useState, useMemo, memo } from 'react'
 import { motion } from 'framer-motion'
 import { useTranslation } from 'react-i18next'
 import { SliderControl, ControlPanel, InfoCard, Toggle } from '../DemoControls'
@@ -17,6 +17,11 @@ import {
   cauchyIndex,
   wavelengthToRGB,
 } from '@/core/WaveOptics'
+import {
+  createAngleTrigTable,
+  createFresnelSweepBuffers,
+  fresnelReflectanceSweep,
+} from '@/lib/opticsPhysics'
 
 // 材料类型定义
 interface MaterialData {
@@ -49,9 +54,32 @@ function getMaterialIndex(material: MaterialData, wavelengthNm: number): number
   return material.fixedN || 1.5
 }
 
+// 各材料在550nm处的布儒斯特角（空气入射），材料选择按钮直接查表
+const MATERIAL_BREWSTER_550 = DISPERSIVE_MATERIALS.map(
+  (m) => (Math.atan(getMaterialIndex(m, 550)) * 180) / Math.PI
+)
+
+// 色散曲线采样波长：380-780nm，步长5nm，共81点（不超过曲线的像素宽度）
+const DISPERSION_WAVELENGTHS = Float64Array.from({ length: 81 }, (_, i) => 380 + i * 5)
+const dispersionCache = new Map<MaterialData, Float64Array>()
+
+// 材料的 n(λ) 采样表：两条色散曲线共用，每种材料只计算一次
+function getDispersionSamples(material: MaterialData): Float64Array {
+  let samples = dispersionCache.get(material)
+  if (!samples) {
+    samples = DISPERSION_WAVELENGTHS.map((wl) => getMaterialIndex(material, wl))
+    dispersionCache.set(material, samples)
+  }
+  return samples
+}
+
+const DEG_TO_RAD = Math.PI / 180
+
+type BrewsterResult = ReturnType<typeof calculateBrewster>
+
 // 计算布儒斯特角和反射率
 function calculateBrewster(theta: number, n1: number, n2: number) {
-  const rad = (theta * Math.PI) / 180
+  const rad = theta * DEG_TO_RAD
   const sinTheta1 = Math.sin(rad)
   const cosTheta1 = Math.cos(rad)
   const sinTheta2 = (n1 / n2) * sinTheta1
@@ -60,7 +88,7 @@ function calculateBrewster(theta: number, n1: number, n2: number) {
     return { Rs: 1, Rp: 1, totalReflection: true, theta2: 90 }
   }
 
-  const cosTheta2 = Math.sqrt(1 - sinTheta2 * sinTheta2)
+  const cosTheta2 = Math.sqrt(Math.max(0, 1 - sinTheta2 * sinTheta2))
   const theta2 = (Math.asin(sinTheta2) * 180) / Math.PI
 
   const rs = (n1 * cosTheta1 - n2 * cosTheta2) / (n1 * cosTheta1 + n2 * cosTheta2)
@@ -74,6 +102,13 @@ function calculateBrewster(theta: number, n1: number, n2: number) {
   }
 }
 
+// 偏振度曲线采样角度（1°-89°）
+const CURVE_ANGLES = Float64Array.from({ length: 89 }, (_, i) => i + 1)
+
+// 采样角的正弦/余弦表只算一次；输出缓冲区在每次生成路径时复用
+const CURVE_TRIG = createAngleTrigTable(CURVE_ANGLES)
+const CURVE_BUFFERS = createFresnelSweepBuffers(CURVE_ANGLES.length)
+
 // 色散曲线图组件 - 显示折射率随波长变化
 function DispersionCurve({
   material,
@@ -84,13 +119,14 @@ function DispersionCurve({
 }) {
   const curveData = useMemo(() => {
     const points: { x: number; y: number; wavelength: number; n: number }[] = []
+    const samples = getDispersionSamples(material)
     let minN = Infinity, maxN = -Infinity
 
-    for (let wl = 380; wl <= 780; wl += 5) {
-      const n = getMaterialIndex(material, wl)
+    for (let i = 0; i < samples.length; i++) {
+      const n = samples[i]
       if (n < minN) minN = n
       if (n > maxN) maxN = n
-      points.push({ wavelength: wl, n, x: 0, y: 0 })
+      points.push({ wavelength: DISPERSION_WAVELENGTHS[i], n, x: 0, y: 0 })
     }
 
     // 添加一些padding
@@ -182,9 +218,11 @@ function BrewsterWavelengthCurve({
 }) {
   const curveData = useMemo(() => {
     const points: { x: number; y: number; wavelength: number; brewster: number }[] = []
+    const samples = getDispersionSamples(material)
 
-    for (let wl = 380; wl <= 780; wl += 5) {
-      const n = getMaterialIndex(material, wl)
+    for (let i = 0; i < samples.length; i++) {
+      const wl = DISPERSION_WAVELENGTHS[i]
+      const n = samples[i]
       const brewster = Math.atan(n) * 180 / Math.PI
       const x = 30 + ((wl - 380) / 400) * 160
       const y = 65 - ((brewster - 50) / 25) * 50 // 假设布儒斯特角在50°-75°范围
@@ -295,16 +333,107 @@ function PolarizationIndicator({
   )
 }
 
+// 图示静态层（渐变定义、介质、界面、法线）：只依赖折射率和标签，入射角变化时跳过重渲染
+const DiagramBackground = memo(function DiagramBackground({
+  n1,
+  n2,
+  airLabel,
+  mediumLabel,
+  normalLabel,
+}: {
+  n1: number
+  n2: number
+  airLabel: string
+  mediumLabel: string
+  normalLabel: string
+}) {
+  const cx = 300
+
+  return (
+    <>
+      <defs>
+        <linearGradient id="airGradient" x1="0%" y1="0%" x2="0%" y2="100%">
+          <stop offset="0%" stopColor="#0f172a" stopOpacity="0.8" />
+          <stop offset="100%" stopColor="#1e3a5f" stopOpacity="0.4" />
+        </linearGradient>
+        <linearGradient id="glassGradient" x1="0%" y1="0%" x2="0%" y2="100%">
+          <stop offset="0%" stopColor="#1e5f5f" stopOpacity="0.3" />
+          <stop offset="100%" stopColor="#0f4c4c" stopOpacity="0.6" />
+        </linearGradient>
+        <filter id="glowYellow" x="-50%" y="-50%" width="200%" height="200%">
+          <feGaussianBlur stdDeviation="4" result="coloredBlur" />
+          <feMerge>
+            <feMergeNode in="coloredBlur" />
+            <feMergeNode in="SourceGraphic" />
+          </feMerge>
+        </filter>
+        <filter id="glowCyan" x="-50%" y="-50%" width="200%" height="200%">
+          <feGaussianBlur stdDeviation="3" result="coloredBlur" />
+          <feMerge>
+            <feMergeNode in="coloredBlur" />
+            <feMergeNode in="SourceGraphic" />
+          </feMerge>
+        </filter>
+      </defs>
+
+      {/* 空气层 */}
+      <rect x="30" y="20" width="540" height="180" fill="url(#airGradient)" rx="8" />
+      <text x="60" y="50" fill="#60a5fa" fontSize="13">{airLabel} n₁ = {n1.toFixed(2)}</text>
+
+      {/* 玻璃/介质层 */}
+      <rect x="30" y="200" width="540" height="180" fill="url(#glassGradient)" rx="8" />
+      <text x="60" y="360" fill="#2dd4bf" fontSize="13">{mediumLabel} n₂ = {n2.toFixed(2)}</text>
+
+      {/* 界面 */}
+      <line x1="30" y1="200" x2="570" y2="200" stroke="#67e8f9" strokeWidth="2" />
+
+      {/* 法线 */}
+      <line x1={cx} y1="30" x2={cx} y2="370" stroke="#94a3b8" strokeWidth="1" strokeDasharray="6 4" opacity="0.6" />
+      <text x={cx + 8} y="45" fill="#94a3b8" fontSize="11">{normalLabel}</text>
+    </>
+  )
+})
+
+// 图例：内容固定，只在语言切换时重渲染
+const DiagramLegend = memo(function DiagramLegend({
+  title,
+  naturalLight,
+  sPol,
+  pPol,
+}: {
+  title: string
+  naturalLight: string
+  sPol: string
+  pPol: string
+}) {
+  return (
+    <g transform="translate(450, 30)">
+      <rect x="0" y="0" width="110" height="90" fill="rgba(30,41,59,0.9)" rx="6" stroke="#475569" strokeWidth="1" />
+      <text x="10" y="18" fill="#94a3b8" fontSize="10">{title}</text>
+      <PolarizationIndicator type="unpolarized" x={25} y={35} size={16} color="#fbbf24" />
+      <text x="45" y="39" fill="#fbbf24" fontSize="10">{naturalLight}</text>
+      <PolarizationIndicator type="s" x={25} y={55} size={16} color="#22d3ee" />
+      <text x="45" y="59" fill="#22d3ee" fontSize="10">{sPol}</text>
+      <PolarizationIndicator type="p" x={25} y={75} size={16} color="#f472b6" />
+      <text x="45" y="79" fill="#f472b6" fontSize="10">{pPol}</text>
+    </g>
+  )
+})
+
 // 布儒斯特角SVG图示
 function BrewsterDiagram({
   incidentAngle,
   n1,
   n2,
+  result,
+  brewsterAngle,
   labels,
 }: {
   incidentAngle: number
   n1: number
   n2: number
+  result: BrewsterResult
+  brewsterAngle: number
   labels: {
     air: string
     medium: string
@@ -320,8 +449,6 @@ function BrewsterDiagram({
     brewsterAngle: string
   }
 }) {
-  const result = calculateBrewster(incidentAngle, n1, n2)
-  const brewsterAngle = (Math.atan(n2 / n1) * 180) / Math.PI
   const isAtBrewster = Math.abs(incidentAngle - brewsterAngle) < 1.5
 
   const rad = (incidentAngle * Math.PI) / 180
@@ -359,45 +486,13 @@ function BrewsterDiagram({
 
   return (
     <svg viewBox="0 0 600 400" className="w-full h-auto">
-      <defs>
-        <linearGradient id="airGradient" x1="0%" y1="0%" x2="0%" y2="100%">
-          <stop offset="0%" stopColor="#0f172a" stopOpacity="0.8" />
-          <stop offset="100%" stopColor="#1e3a5f" stopOpacity="0.4" />
-        </linearGradient>
-        <linearGradient id="glassGradient" x1="0%" y1="0%" x2="0%" y2="100%">
-          <stop offset="0%" stopColor="#1e5f5f" stopOpacity="0.3" />
-          <stop offset="100%" stopColor="#0f4c4c" stopOpacity="0.6" />
-        </linearGradient>
-        <filter id="glowYellow" x="-50%" y="-50%" width="200%" height="200%">
-          <feGaussianBlur stdDeviation="4" result="coloredBlur" />
-          <feMerge>
-            <feMergeNode in="coloredBlur" />
-            <feMergeNode in="SourceGraphic" />
-          </feMerge>
-        </filter>
-        <filter id="glowCyan" x="-50%" y="-50%" width="200%" height="200%">
-          <feGaussianBlur stdDeviation="3" result="coloredBlur" />
-          <feMerge>
-            <feMergeNode in="coloredBlur" />
-            <feMergeNode in="SourceGraphic" />
-          </feMerge>
-        </filter>
-      </defs>
-
-      {/* 空气层 */}
-      <rect x="30" y="20" width="540" height="180" fill="url(#airGradient)" rx="8" />
-      <text x="60" y="50" fill="#60a5fa" fontSize="13">{labels.air} n₁ = {n1.toFixed(2)}</text>
-
-      {/* 玻璃/介质层 */}
-      <rect x="30" y="200" width="540" height="180" fill="url(#glassGradient)" rx="8" />
-      <text x="60" y="360" fill="#2dd4bf" fontSize="13">{labels.medium} n₂ = {n2.toFixed(2)}</text>
-
-      {/* 界面 */}
-      <line x1="30" y1="200" x2="570" y2="200" stroke="#67e8f9" strokeWidth="2" />
-
-      {/* 法线 */}
-      <line x1={cx} y1="30" x2={cx} y2="370" stroke="#94a3b8" strokeWidth="1" strokeDasharray="6 4" opacity="0.6" />
-      <text x={cx + 8} y="45" fill="#94a3b8" fontSize="11">{labels.normal}</text>
+      <DiagramBackground
+        n1={n1}
+        n2={n2}
+        airLabel={labels.air}
+        mediumLabel={labels.medium}
+        normalLabel={labels.normal}
+      />
 
       {/* 光源 */}
       <motion.circle
@@ -580,50 +675,84 @@ function BrewsterDiagram({
       )}
 
       {/* 图例 */}
-      <g transform="translate(450, 30)">
-        <rect x="0" y="0" width="110" height="90" fill="rgba(30,41,59,0.9)" rx="6" stroke="#475569" strokeWidth="1" />
-        <text x="10" y="18" fill="#94a3b8" fontSize="10">{labels.polarizationStates}</text>
-        <PolarizationIndicator type="unpolarized" x={25} y={35} size={16} color="#fbbf24" />
-        <text x="45" y="39" fill="#fbbf24" fontSize="10">{labels.naturalLight}</text>
-        <PolarizationIndicator type="s" x={25} y={55} size={16} color="#22d3ee" />
-        <text x="45" y="59" fill="#22d3ee" fontSize="10">{labels.sPol}</text>
-        <PolarizationIndicator type="p" x={25} y={75} size={16} color="#f472b6" />
-        <text x="45" y="79" fill="#f472b6" fontSize="10">{labels.pPol}</text>
-      </g>
+      <DiagramLegend
+        title={labels.polarizationStates}
+        naturalLight={labels.naturalLight}
+        sPol={labels.sPol}
+        pPol={labels.pPol}
+      />
     </svg>
   )
 }
 
+// 偏振度曲线的坐标框与刻度：完全静态，只渲染一次
+const DegreeChartAxes = memo(function DegreeChartAxes() {
+  return (
+    <>
+      <rect x="40" y="30" width="220" height="100" fill="#1e293b" rx="4" />
+
+      {/* 坐标轴 */}
+      <line x1="40" y1="130" x2="270" y2="130" stroke="#475569" strokeWidth="1" />
+      <line x1="40" y1="30" x2="40" y2="130" stroke="#475569" strokeWidth="1" />
+
+      {/* X轴刻度 */}
+      {[0, 45, 90].map((angle) => {
+        const x = 40 + (angle / 90) * 220
+        return (
+          <g key={angle}>
+            <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
+            <text x={x} y="147" textAnchor="middle" fill="#94a3b8" fontSize="10">{angle}°</text>
+          </g>
+        )
+      })}
+
+      {/* Y轴刻度 */}
+      {[0, 0.5, 1].map((val, i) => {
+        const y = 130 - val * 100
+        return (
+          <g key={i}>
+            <text x="30" y={y + 4} textAnchor="end" fill="#94a3b8" fontSize="10">{(val * 100).toFixed(0)}%</text>
+          </g>
+        )
+      })}
+    </>
+  )
+})
+
 // 偏振度曲线图
 function PolarizationDegreeChart({
   n1,
   n2,
   currentAngle,
+  currentPD,
+  brewsterAngle,
 }: {
   n1: number
   n2: number
   currentAngle: number
+  currentPD: number
+  brewsterAngle: number
 }) {
-  const brewsterAngle = (Math.atan(n2 / n1) * 180) / Math.PI
-
   const { pdPath, rsPath, rpPath } = useMemo(() => {
     const pdPoints: string[] = []
     const rsPoints: string[] = []
     const rpPoints: string[] = []
-
-    for (let angle = 1; angle <= 89; angle += 1) {
-      const result = calculateBrewster(angle, n1, n2)
-      if (result.totalReflection) continue
-
-      const pd = Math.abs(result.Rs - result.Rp) / (result.Rs + result.Rp + 0.001)
-      const x = 40 + (angle / 90) * 220
+    // 光从空气射入折射率大于 1 的材料，不会发生全内反射，每个采样点都在曲线上
+    fresnelReflectanceSweep(CURVE_TRIG, n1, n2, CURVE_BUFFERS)
+    const { Rs: curveRs, Rp: curveRp } = CURVE_BUFFERS
+
+    for (let i = 0; i < CURVE_ANGLES.length; i++) {
+      const Rs = curveRs[i]
+      const Rp = curveRp[i]
+      const pd = Math.abs(Rs - Rp) / (Rs + Rp + 0.001)
+      const x = 40 + (CURVE_ANGLES[i] / 90) * 220
       const yPd = 130 - pd * 100
-      const yRs = 130 - result.Rs * 100
-      const yRp = 130 - result.Rp * 100
+      const yRs = 130 - Rs * 100
+      const yRp = 130 - Rp * 100
 
-      pdPoints.push(`${angle === 1 ? 'M' : 'L'} ${x},${yPd}`)
-      rsPoints.push(`${angle === 1 ? 'M' : 'L'} ${x},${yRs}`)
-      rpPoints.push(`${angle === 1 ? 'M' : 'L'} ${x},${yRp}`)
+      pdPoints.push(`${i === 0 ? 'M' : 'L'} ${x},${yPd}`)
+      rsPoints.push(`${i === 0 ? 'M' : 'L'} ${x},${yRs}`)
+      rpPoints.push(`${i === 0 ? 'M' : 'L'} ${x},${yRp}`)
     }
 
     return {
@@ -633,39 +762,12 @@ function PolarizationDegreeChart({
     }
   }, [n1, n2])
 
-  const currentResult = calculateBrewster(currentAngle, n1, n2)
-  const currentPD = Math.abs(currentResult.Rs - currentResult.Rp) / (currentResult.Rs + currentResult.Rp + 0.001)
   const currentX = 40 + (currentAngle / 90) * 220
   const currentY = 130 - currentPD * 100
 
   return (
     <svg viewBox="0 0 300 160" className="w-full h-auto">
-      <rect x="40" y="30" width="220" height="100" fill="#1e293b" rx="4" />
-
-      {/* 坐标轴 */}
-      <line x1="40" y1="130" x2="270" y2="130" stroke="#475569" strokeWidth="1" />
-      <line x1="40" y1="30" x2="40" y2="130" stroke="#475569" strokeWidth="1" />
-
-      {/* X轴刻度 */}
-      {[0, 45, 90].map((angle) => {
-        const x = 40 + (angle / 90) * 220
-        return (
-          <g key={angle}>
-            <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
-            <text x={x} y="147" textAnchor="middle" fill="#94a3b8" fontSize="10">{angle}°</text>
-          </g>
-        )
-      })}
-
-      {/* Y轴刻度 */}
-      {[0, 0.5, 1].map((val, i) => {
-        const y = 130 - val * 100
-        return (
-          <g key={i}>
-            <text x="30" y={y + 4} textAnchor="end" fill="#94a3b8" fontSize="10">{(val * 100).toFixed(0)}%</text>
-          </g>
-        )
-      })}
+      <DegreeChartAxes />
 
       {/* 布儒斯特角标记 */}
       <line
@@ -730,6 +832,7 @@ export function BrewsterDemo() {
     ? getMaterialIndex(currentMaterial, wavelength)
     : getMaterialIndex(currentMaterial, 550) // 固定在550nm
 
+  // 当前入射角的菲涅尔结果每次渲染只算一次，图示和曲线共用
   const brewsterAngle = (Math.atan(n2 / n1) * 180) / Math.PI
   const result = calculateBrewster(incidentAngle, n1, n2)
   const isAtBrewster = Math.abs(incidentAngle - brewsterAngle) < 1.5
@@ -744,8 +847,8 @@ export function BrewsterDemo() {
     return Math.abs(brewsterBlue - brewsterRed)
   }, [currentMaterial])
 
-  // 图表标签翻译
-  const diagramLabels = {
+  // 图表标签翻译：只随语言切换重建，静态图层拿到的标签文本保持不变
+  const diagramLabels = useMemo(() => ({
     air: t('demoUi.brewster.air'),
     medium: t('demoUi.brewster.medium'),
     normal: t('demoUi.brewster.normal'),
@@ -758,7 +861,13 @@ export function BrewsterDemo() {
     sPol: t('demoUi.brewster.sPol'),
     pPol: t('demoUi.brewster.pPol'),
     brewsterAngle: t('demoUi.brewster.brewsterTitle'),
-  }
+  }), [t])
+
+  // 公式文本只依赖折射率，拖动入射角时不必重新格式化
+  const formulaText = useMemo(
+    () => `tan(θB) = n₂/n₁ = ${n2.toFixed(2)}/${n1.toFixed(2)} = ${(n2 / n1).toFixed(3)}`,
+    [n1, n2]
+  )
 
   return (
     <div className="space-y-6">
@@ -777,7 +886,14 @@ export function BrewsterDemo() {
         {/* 左侧：可视化 */}
         <div className="space-y-4">
           <div className="rounded-xl bg-gradient-to-br from-slate-900/90 via-slate-900/95 to-cyan-950/90 border border-cyan-500/30 p-4 shadow-[0_15px_40px_rgba(0,0,0,0.5)]">
-            <BrewsterDiagram incidentAngle={incidentAngle} n1={n1} n2={n2} labels={diagramLabels} />
+            <BrewsterDiagram
+              incidentAngle={incidentAngle}
+              n1={n1}
+              n2={n2}
+              result={result}
+              brewsterAngle={brewsterAngle}
+              labels={diagramLabels}
+            />
           </div>
 
           {/* 状态指示 */}
@@ -875,8 +991,7 @@ export function BrewsterDemo() {
               <div className="text-xs text-gray-500 mb-2">{t('demoUi.brewster.selectMaterial')}</div>
               <div className="grid grid-cols-2 gap-1.5">
                 {DISPERSIVE_MATERIALS.map((m, index) => {
-                  const matN = getMaterialIndex(m, 550)
-                  const matBrewster = Math.atan(matN) * 180 / Math.PI
+                  const matBrewster = MATERIAL_BREWSTER_550[index]
                   const isSelected = index === selectedMaterialIndex
                   return (
                     <button
@@ -951,14 +1066,20 @@ export function BrewsterDemo() {
             {/* 公式 */}
             <div className="mt-3 p-3 bg-slate-900/50 rounded-lg text-center">
               <span className="font-mono text-lg bg-gradient-to-r from-cyan-400 to-white bg-clip-text text-transparent">
-                tan(θB) = n₂/n₁ = {n2.toFixed(2)}/{n1.toFixed(2)} = {(n2/n1).toFixed(3)}
+                {formulaText}
               </span>
             </div>
           </ControlPanel>
 
           {/* 偏振度曲线 */}
           <ControlPanel title={t('demoUi.brewster.reflectedPolDegree')}>
-            <PolarizationDegreeChart n1={n1} n2={n2} currentAngle={incidentAngle} />
+            <PolarizationDegreeChart
+              n1={n1}
+              n2={n2}
+              currentAngle={incidentAngle}
+              currentPD={polarizationDegree}
+              brewsterAngle={brewsterAngle}
+            />
             <p className="text-xs text-gray-400 mt-2">
               {t('demoUi.brewster.chartDesc')}
             </p>
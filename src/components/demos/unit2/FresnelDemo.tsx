@@ -3,13 +3,22 @@
  * 演示s偏振和p偏振的反射/透射系数随入射角的变化
  * 采用纯DOM + SVG + Framer Motion一体化设计
  */
-import { useState, useMemo } from 'react'
+import { useState, useMemo, useDeferredValue, memo } from 'react'
 import { motion } from 'framer-motion'
 import { SliderControl, ControlPanel, InfoCard } from '../DemoControls'
+import {
+  createAngleTrigTable,
+  createFresnelSweepBuffers,
+  fresnelReflectanceSweep,
+} from '@/lib/opticsPhysics'
+
+// 角度/弧度换算系数，标量计算直接相乘
+const DEG_TO_RAD = Math.PI / 180
+const RAD_TO_DEG = 180 / Math.PI
 
 // 菲涅尔方程计算
 function fresnelEquations(theta1: number, n1: number, n2: number) {
-  const rad = (theta1 * Math.PI) / 180
+  const rad = theta1 * DEG_TO_RAD
   const sinTheta1 = Math.sin(rad)
   const cosTheta1 = Math.cos(rad)
 
@@ -24,12 +33,14 @@ function fresnelEquations(theta1: number, n1: number, n2: number) {
       ts: 0,
       tp: 0,
       theta2: 90,
+      sinTheta2: 1,
+      cosTheta2: 0,
       totalReflection: true,
     }
   }
 
-  const cosTheta2 = Math.sqrt(1 - sinTheta2 * sinTheta2)
-  const theta2 = (Math.asin(sinTheta2) * 180) / Math.PI
+  const cosTheta2 = Math.sqrt(Math.max(0, 1 - sinTheta2 * sinTheta2))
+  const theta2 = Math.asin(sinTheta2) * RAD_TO_DEG
 
   // s偏振（垂直于入射面）
   const rs = (n1 * cosTheta1 - n2 * cosTheta2) / (n1 * cosTheta1 + n2 * cosTheta2)
@@ -45,10 +56,32 @@ function fresnelEquations(theta1: number, n1: number, n2: number) {
     ts,
     tp,
     theta2,
+    sinTheta2,
+    cosTheta2,
     totalReflection: false,
   }
 }
 
+type FresnelResult = ReturnType<typeof fresnelEquations>
+
+// 布儒斯特角与临界角（仅 n₁ > n₂ 时存在）
+function specialAngles(n1: number, n2: number): { brewsterAngle: number; criticalAngle: number | null } {
+  return {
+    brewsterAngle: Math.atan(n2 / n1) * RAD_TO_DEG,
+    criticalAngle: n1 > n2 ? Math.asin(n2 / n1) * RAD_TO_DEG : null,
+  }
+}
+
+// 反射率曲线采样角度（0°-90°，步长1°）
+const CURVE_ANGLES = Float64Array.from({ length: 91 }, (_, i) => i)
+
+// 与折射率无关的量只算一次：采样角的正弦/余弦表及其在图上的横坐标
+const CURVE_TRIG = createAngleTrigTable(CURVE_ANGLES)
+const CURVE_X = CURVE_ANGLES.map((deg) => 40 + (deg / 90) * 220)
+
+// 曲线扫描的输出缓冲区，每次重建路径时复用
+const CURVE_BUFFERS = createFresnelSweepBuffers(CURVE_ANGLES.length)
+
 // 光强条组件
 function IntensityBar({
   label,
@@ -104,60 +137,18 @@ function IntensityBar({
   )
 }
 
-// 光线SVG可视化
-function FresnelDiagram({
-  incidentAngle,
+// 光线图静态层（渐变定义、介质、界面、法线）：只依赖折射率，入射角变化时跳过重渲染
+const FresnelDiagramBackground = memo(function FresnelDiagramBackground({
   n1,
   n2,
-  showS,
-  showP,
 }: {
-  incidentAngle: number
   n1: number
   n2: number
-  showS: boolean
-  showP: boolean
 }) {
-  const fresnel = fresnelEquations(incidentAngle, n1, n2)
-  const rad = (incidentAngle * Math.PI) / 180
-  const refractRad = (fresnel.theta2 * Math.PI) / 180
-
-  // SVG坐标系中心点
   const cx = 300
-  const cy = 180
-  const rayLength = 140
-
-  // 入射光起点和方向
-  const incidentStart = {
-    x: cx - rayLength * Math.sin(rad),
-    y: cy - rayLength * Math.cos(rad),
-  }
-
-  // 反射光终点
-  const reflectEnd = {
-    x: cx + rayLength * Math.sin(rad),
-    y: cy - rayLength * Math.cos(rad),
-  }
-
-  // 折射光终点
-  const refractEnd = fresnel.totalReflection
-    ? { x: cx, y: cy }
-    : {
-        x: cx + rayLength * Math.sin(refractRad),
-        y: cy + rayLength * Math.cos(refractRad),
-      }
-
-  // 反射率
-  const Rs = fresnel.rs * fresnel.rs
-  const Rp = fresnel.rp * fresnel.rp
-  const Ts = 1 - Rs
-  const Tp = 1 - Rp
-
-  // 布儒斯特角
-  const brewsterAngle = (Math.atan(n2 / n1) * 180) / Math.PI
 
   return (
-    <svg viewBox="0 0 600 360" className="w-full h-auto">
+    <>
       <defs>
         {/* 渐变定义 */}
         <linearGradient id="medium1Gradient" x1="0%" y1="0%" x2="0%" y2="100%">
@@ -196,6 +187,68 @@ function FresnelDiagram({
       {/* 法线 */}
       <line x1={cx} y1="40" x2={cx} y2="320" stroke="#94a3b8" strokeWidth="1" strokeDasharray="4 4" opacity="0.5" />
       <text x={cx + 10} y="55" fill="#94a3b8" fontSize="11">法线</text>
+    </>
+  )
+})
+
+// 光线SVG可视化
+function FresnelDiagram({
+  incidentAngle,
+  n1,
+  n2,
+  fresnel,
+  brewsterAngle,
+  showS,
+  showP,
+}: {
+  incidentAngle: number
+  n1: number
+  n2: number
+  fresnel: FresnelResult
+  brewsterAngle: number
+  showS: boolean
+  showP: boolean
+}) {
+  const rad = incidentAngle * DEG_TO_RAD
+  // 折射方向直接用 sinθ₂/cosθ₂，不再从角度值换算回弧度
+  const { sinTheta2, cosTheta2 } = fresnel
+  // 半角正弦：sin(θ₂/2) = √((1 - cosθ₂)/2)
+  const sinHalfTheta2 = Math.sqrt((1 - cosTheta2) / 2)
+
+  // SVG坐标系中心点
+  const cx = 300
+  const cy = 180
+  const rayLength = 140
+
+  // 入射光起点和方向
+  const incidentStart = {
+    x: cx - rayLength * Math.sin(rad),
+    y: cy - rayLength * Math.cos(rad),
+  }
+
+  // 反射光终点
+  const reflectEnd = {
+    x: cx + rayLength * Math.sin(rad),
+    y: cy - rayLength * Math.cos(rad),
+  }
+
+  // 折射光终点
+  const refractEnd = fresnel.totalReflection
+    ? { x: cx, y: cy }
+    : {
+        x: cx + rayLength * sinTheta2,
+        y: cy + rayLength * cosTheta2,
+      }
+
+  // 反射率
+  const Rs = fresnel.rs * fresnel.rs
+  const Rp = fresnel.rp * fresnel.rp
+  const Ts = 1 - Rs
+  const Tp = 1 - Rp
+
+  return (
+    <svg viewBox="0 0 600 360" className="w-full h-auto">
+      <FresnelDiagramBackground n1={n1} n2={n2} />
 
       {/* 入射光（黄色） */}
       <motion.line
@@ -465,14 +518,14 @@ function FresnelDiagram({
       {!fresnel.totalReflection && (
         <>
           <path
-            d={`M ${cx} ${cy + 40} A 40 40 0 0 1 ${cx + 40 * Math.sin(refractRad)} ${cy + 40 * Math.cos(refractRad)}`}
+            d={`M ${cx} ${cy + 40} A 40 40 0 0 1 ${cx + 40 * sinTheta2} ${cy + 40 * cosTheta2}`}
             fill="none"
             stroke="#4ade80"
             strokeWidth="1.5"
             strokeDasharray="3 2"
           />
           <text
-            x={cx + 15 + 15 * Math.sin(refractRad / 2)}
+            x={cx + 15 + 15 * sinHalfTheta2}
             y={cy + 60}
             fill="#4ade80"
             fontSize="13"
@@ -519,54 +572,10 @@ function FresnelDiagram({
   )
 }
 
-// 菲涅尔曲线图
-function FresnelCurveChart({
-  n1,
-  n2,
-  currentAngle,
-}: {
-  n1: number
-  n2: number
-  currentAngle: number
-}) {
-  // 生成曲线数据
-  const { rsPath, rpPath, brewsterAngle, criticalAngle } = useMemo(() => {
-    const rsPoints: string[] = []
-    const rpPoints: string[] = []
-
-    const brewster = (Math.atan(n2 / n1) * 180) / Math.PI
-    const critical = n1 > n2 ? (Math.asin(n2 / n1) * 180) / Math.PI : 90
-
-    for (let angle = 0; angle <= 90; angle += 1) {
-      const f = fresnelEquations(angle, n1, n2)
-      const Rs = f.rs * f.rs
-      const Rp = f.rp * f.rp
-
-      const x = 40 + (angle / 90) * 220
-      const yRs = 130 - Rs * 100
-      const yRp = 130 - Rp * 100
-
-      rsPoints.push(`${angle === 0 ? 'M' : 'L'} ${x},${yRs}`)
-      rpPoints.push(`${angle === 0 ? 'M' : 'L'} ${x},${yRp}`)
-    }
-
-    return {
-      rsPath: rsPoints.join(' '),
-      rpPath: rpPoints.join(' '),
-      brewsterAngle: brewster,
-      criticalAngle: critical,
-    }
-  }, [n1, n2])
-
-  const currentX = 40 + (currentAngle / 90) * 220
-  const currentFresnel = fresnelEquations(currentAngle, n1, n2)
-  const currentRs = currentFresnel.rs * currentFresnel.rs
-  const currentRp = currentFresnel.rp * currentFresnel.rp
-  const currentYs = 130 - currentRs * 100
-  const currentYp = 130 - currentRp * 100
-
+// 曲线图的坐标框、网格与刻度：完全静态，只渲染一次
+const CurveChartAxes = memo(function CurveChartAxes() {
   return (
-    <svg viewBox="0 0 300 160" className="w-full h-auto">
+    <>
       {/* 背景网格 */}
       <rect x="40" y="30" width="220" height="100" fill="#1e293b" rx="4" />
 
@@ -599,6 +608,67 @@ function FresnelCurveChart({
           </g>
         )
       })}
+    </>
+  )
+})
+
+// 曲线图的轴标签与图例：完全静态，只渲染一次
+const CurveChartLegend = memo(function CurveChartLegend() {
+  return (
+    <>
+      {/* 轴标签 */}
+      <text x="155" y="158" textAnchor="middle" fill="#94a3b8" fontSize="11">θ (度)</text>
+      <text x="15" y="85" fill="#94a3b8" fontSize="11" transform="rotate(-90 15 85)">R</text>
+
+      {/* 图例 */}
+      <g transform="translate(200, 40)">
+        <line x1="0" y1="0" x2="20" y2="0" stroke="#22d3ee" strokeWidth="2" />
+        <text x="25" y="4" fill="#22d3ee" fontSize="10">Rs</text>
+        <line x1="0" y1="15" x2="20" y2="15" stroke="#f472b6" strokeWidth="2" />
+        <text x="25" y="19" fill="#f472b6" fontSize="10">Rp</text>
+      </g>
+    </>
+  )
+})
+
+// 菲涅尔曲线图
+// 曲线、特征角标记与当前点都由同一组 n₁/n₂ 计算，延迟渲染期间标记不会偏离曲线
+const FresnelCurveChart = memo(function FresnelCurveChart({
+  n1,
+  n2,
+  currentAngle,
+}: {
+  n1: number
+  n2: number
+  currentAngle: number
+}) {
+  // 生成曲线数据
+  const { rsPath, rpPath } = useMemo(() => {
+    fresnelReflectanceSweep(CURVE_TRIG, n1, n2, CURVE_BUFFERS)
+    const { Rs, Rp } = CURVE_BUFFERS
+
+    // 直接拼接路径字符串，不经过逐点数组再 join
+    let rsPath = `M ${CURVE_X[0]},${130 - Rs[0] * 100}`
+    let rpPath = `M ${CURVE_X[0]},${130 - Rp[0] * 100}`
+    for (let i = 1; i < CURVE_ANGLES.length; i++) {
+      const x = CURVE_X[i]
+      rsPath += ` L ${x},${130 - Rs[i] * 100}`
+      rpPath += ` L ${x},${130 - Rp[i] * 100}`
+    }
+
+    return { rsPath, rpPath }
+  }, [n1, n2])
+
+  const { brewsterAngle, criticalAngle } = useMemo(() => specialAngles(n1, n2), [n1, n2])
+
+  const current = fresnelEquations(currentAngle, n1, n2)
+  const currentX = 40 + (currentAngle / 90) * 220
+  const currentYs = 130 - current.rs * current.rs * 100
+  const currentYp = 130 - current.rp * current.rp * 100
+
+  return (
+    <svg viewBox="0 0 300 160" className="w-full h-auto">
+      <CurveChartAxes />
 
       {/* 布儒斯特角标记 */}
       {n1 < n2 && (
@@ -625,7 +695,7 @@ function FresnelCurveChart({
       )}
 
       {/* 临界角标记 */}
-      {n1 > n2 && criticalAngle < 90 && (
+      {criticalAngle !== null && (
         <>
           <line
             x1={40 + (criticalAngle / 90) * 220}
@@ -672,20 +742,10 @@ function FresnelCurveChart({
         transition={{ duration: 0.2 }}
       />
 
-      {/* 轴标签 */}
-      <text x="155" y="158" textAnchor="middle" fill="#94a3b8" fontSize="11">θ (度)</text>
-      <text x="15" y="85" fill="#94a3b8" fontSize="11" transform="rotate(-90 15 85)">R</text>
-
-      {/* 图例 */}
-      <g transform="translate(200, 40)">
-        <line x1="0" y1="0" x2="20" y2="0" stroke="#22d3ee" strokeWidth="2" />
-        <text x="25" y="4" fill="#22d3ee" fontSize="10">Rs</text>
-        <line x1="0" y1="15" x2="20" y2="15" stroke="#f472b6" strokeWidth="2" />
-        <text x="25" y="19" fill="#f472b6" fontSize="10">Rp</text>
-      </g>
+      <CurveChartLegend />
     </svg>
   )
-}
+})
 
 // 主演示组件
 export function FresnelDemo() {
@@ -695,16 +755,20 @@ export function FresnelDemo() {
   const [showS, setShowS] = useState(true)
   const [showP, setShowP] = useState(true)
 
+  // 当前入射角的菲涅尔结果每次渲染只算一次，光线图、强度条和曲线共用
   const fresnel = fresnelEquations(incidentAngle, n1, n2)
   const Rs = fresnel.rs * fresnel.rs
   const Rp = fresnel.rp * fresnel.rp
   const Ts = 1 - Rs
   const Tp = 1 - Rp
 
-  // 布儒斯特角
-  const brewsterAngle = (Math.atan(n2 / n1) * 180) / Math.PI
-  // 临界角
-  const criticalAngle = n1 > n2 ? (Math.asin(n2 / n1) * 180) / Math.PI : null
+  // 布儒斯特角与临界角只随折射率变化，拖动入射角时直接复用
+  const { brewsterAngle, criticalAngle } = useMemo(() => specialAngles(n1, n2), [n1, n2])
+
+  // 曲线重建交给低优先级渲染：快速拖动折射率滑块时只重建最新一组 n₁/n₂ 的曲线，
+  // 被后续输入打断的中间值直接丢弃，光线图和读数仍即时更新
+  const curveN1 = useDeferredValue(n1)
+  const curveN2 = useDeferredValue(n2)
 
   // 材料预设
   const materials = [
@@ -736,6 +800,8 @@ export function FresnelDemo() {
               incidentAngle={incidentAngle}
               n1={n1}
               n2={n2}
+              fresnel={fresnel}
+              brewsterAngle={brewsterAngle}
               showS={showS}
               showP={showP}
             />
@@ -865,7 +931,11 @@ export function FresnelDemo() {
 
           {/* 反射率曲线 */}
           <ControlPanel title="反射率曲线 R(θ)">
-            <FresnelCurveChart n1={n1} n2={n2} currentAngle={incidentAngle} />
+            <FresnelCurveChart
+              n1={curveN1}
+              n2={curveN2}
+              currentAngle={incidentAngle}
+            />
             <p className="text-xs text-gray-400 mt-2">
               红点表示当前入射角对应的反射率。在布儒斯特角处，p偏振反射率为零。
             </p>
@@ -3,7 +3,7 @@
  * 演示双折射材料中白光的彩色干涉效应
  * 采用纯DOM + SVG + Framer Motion一体化设计
  */
-import { useState, useMemo } from 'react'
+import { useState, useMemo, useEffect } from 'react'
 import { motion } from 'framer-motion'
 import { SliderControl, ControlPanel, InfoCard } from '../DemoControls'
 import { MediaGalleryPanel } from './MediaGalleryPanel'
@@ -93,16 +93,29 @@ function calculateTransmission(
   return Math.max(0, Math.min(1, transmission))
 }
 
+// 颜色积分用的波长网格（380-780nm，步长2nm）及各波长的RGB分量
+// 与参数无关，一次性建表并按通道分列存储，积分循环内不再逐个做分段判断
+// 波长为整数，用 Float32 精确存储即可
+const MIX_WAVELENGTHS = Float32Array.from({ length: 201 }, (_, i) => 380 + i * 2)
+const MIX_R = new Float64Array(MIX_WAVELENGTHS.length)
+const MIX_G = new Float64Array(MIX_WAVELENGTHS.length)
+const MIX_B = new Float64Array(MIX_WAVELENGTHS.length)
+for (let i = 0; i < MIX_WAVELENGTHS.length; i++) {
+  const [r, g, b] = wavelengthToRGB(MIX_WAVELENGTHS[i])
+  MIX_R[i] = r
+  MIX_G[i] = g
+  MIX_B[i] = b
+}
+
 // 计算白光参考值（用于正确归一化颜色）
 // 预计算所有波长传输率为1时的RGB积分值
 function getWhiteReference(): { r: number; g: number; b: number } {
   let totalR = 0, totalG = 0, totalB = 0
 
-  for (let wavelength = 380; wavelength <= 780; wavelength += 2) {
-    const [r, g, b] = wavelengthToRGB(wavelength)
-    totalR += r
-    totalG += g
-    totalB += b
+  for (let i = 0; i < MIX_WAVELENGTHS.length; i++) {
+    totalR += MIX_R[i]
+    totalG += MIX_G[i]
+    totalB += MIX_B[i]
   }
 
   return { r: totalR, g: totalG, b: totalB }
@@ -122,20 +135,19 @@ function calculateMixedColor(
 
   // 使用人眼光谱响应权重（近似CIE标准观察者）
   // 对可见光谱积分，步长更细以提高精度
-  for (let wavelength = 380; wavelength <= 780; wavelength += 2) {
+  for (let i = 0; i < MIX_WAVELENGTHS.length; i++) {
     const transmission = calculateTransmission(
-      wavelength,
+      MIX_WAVELENGTHS[i],
       thickness,
       birefringence,
       polarizerAngle,
       analyzerAngle
     )
-    const [r, g, b] = wavelengthToRGB(wavelength)
 
     // 假设白光源为等能光谱（可以改为D65标准光源）
-    totalR += r * transmission
-    totalG += g * transmission
-    totalB += b * transmission
+    totalR += MIX_R[i] * transmission
+    totalG += MIX_G[i] * transmission
+    totalB += MIX_B[i] * transmission
   }
 
   // 计算总透过光能量（用于判断亮度）
@@ -348,22 +360,43 @@ function OpticalPathDiagram({
   )
 }
 
+// 光谱背景渐变色标（400-700nm 等分11点）与波长刻度颜色，与参数无关，模块加载时算好
+const SPECTRUM_GRADIENT_STOPS = Array.from({ length: 11 }, (_, i) => {
+  const [r, g, b] = wavelengthToRGB(400 + (i / 10) * 300)
+  return `rgb(${Math.round(r * 255)}, ${Math.round(g * 255)}, ${Math.round(b * 255)})`
+})
+
+const SPECTRUM_TICKS = [400, 500, 600, 700].map((wl) => {
+  const [r, g, b] = wavelengthToRGB(wl)
+  return {
+    wl,
+    x: 40 + ((wl - 400) / 300) * 250,
+    color: `rgb(${r * 255}, ${g * 255}, ${b * 255})`,
+  }
+})
+
+// 透过率曲线采样步长（nm）：按住滑块拖动时用粗网格（21点），松开后恢复细网格（101点）
+const SPECTRUM_STEP_FINE = 3
+const SPECTRUM_STEP_COARSE = 15
+
 // 光谱透过率图
 function SpectrumChart({
   thickness,
   birefringence,
   polarizerAngle,
   analyzerAngle,
+  step = SPECTRUM_STEP_FINE,
 }: {
   thickness: number
   birefringence: number
   polarizerAngle: number
   analyzerAngle: number
+  step?: number
 }) {
-  const { pathData, spectrumGradient } = useMemo(() => {
+  const { pathData } = useMemo(() => {
     const points: string[] = []
 
-    for (let wavelength = 400; wavelength <= 700; wavelength += 3) {
+    for (let wavelength = 400; wavelength <= 700; wavelength += step) {
       const transmission = calculateTransmission(
         wavelength,
         thickness,
@@ -377,25 +410,16 @@ function SpectrumChart({
       points.push(`${wavelength === 400 ? 'M' : 'L'} ${x},${y}`)
     }
 
-    // 生成光谱渐变
-    const stops: string[] = []
-    for (let i = 0; i <= 10; i++) {
-      const wavelength = 400 + (i / 10) * 300
-      const [r, g, b] = wavelengthToRGB(wavelength)
-      stops.push(`rgb(${Math.round(r * 255)}, ${Math.round(g * 255)}, ${Math.round(b * 255)})`)
-    }
-
     return {
       pathData: points.join(' '),
-      spectrumGradient: stops,
     }
-  }, [thickness, birefringence, polarizerAngle, analyzerAngle])
+  }, [thickness, birefringence, polarizerAngle, analyzerAngle, step])
 
   return (
     <svg viewBox="0 0 320 170" className="w-full h-auto">
       <defs>
         <linearGradient id="spectrumBg" x1="0%" y1="0%" x2="100%" y2="0%">
-          {spectrumGradient.map((color, i) => (
+          {SPECTRUM_GRADIENT_STOPS.map((color, i) => (
             <stop key={i} offset={`${i * 10}%`} stopColor={color} stopOpacity="0.2" />
           ))}
         </linearGradient>
@@ -409,18 +433,14 @@ function SpectrumChart({
       <line x1="40" y1="30" x2="40" y2="130" stroke="#475569" strokeWidth="1" />
 
       {/* X轴刻度 */}
-      {[400, 500, 600, 700].map((wl) => {
-        const x = 40 + ((wl - 400) / 300) * 250
-        const [r, g, b] = wavelengthToRGB(wl)
-        return (
-          <g key={wl}>
-            <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
-            <text x={x} y="148" textAnchor="middle" fill={`rgb(${r * 255}, ${g * 255}, ${b * 255})`} fontSize="10">
-              {wl}
-            </text>
-          </g>
-        )
-      })}
+      {SPECTRUM_TICKS.map(({ wl, x, color }) => (
+        <g key={wl}>
+          <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
+          <text x={x} y="148" textAnchor="middle" fill={color} fontSize="10">
+            {wl}
+          </text>
+        </g>
+      ))}
 
       {/* Y轴刻度 */}
       {[0, 0.5, 1].map((val, i) => {
@@ -480,6 +500,28 @@ export function ChromaticDemo() {
   const [polarizerAngle, setPolarizerAngle] = useState(0)
   const [analyzerAngle, setAnalyzerAngle] = useState(90)
 
+  // 按住滑块拖动期间曲线用粗网格保证跟手，松开指针后以细网格重绘一次；
+  // 键盘调节或点击预设不经过拖动，直接按细网格绘制
+  const [isDragging, setIsDragging] = useState(false)
+
+  useEffect(() => {
+    if (!isDragging) return
+    // 指针可能在滑块之外松开，因此监听整个窗口
+    const endDrag = () => setIsDragging(false)
+    window.addEventListener('pointerup', endDrag)
+    window.addEventListener('pointercancel', endDrag)
+    return () => {
+      window.removeEventListener('pointerup', endDrag)
+      window.removeEventListener('pointercancel', endDrag)
+    }
+  }, [isDragging])
+
+  const handleControlsPointerDown = (e: React.PointerEvent<HTMLDivElement>) => {
+    if (e.target instanceof HTMLInputElement && e.target.type === 'range') {
+      setIsDragging(true)
+    }
+  }
+
   // 预设材料
   const materials = [
     { name: '塑料薄膜', br: 0.005 },
@@ -547,7 +589,7 @@ export function ChromaticDemo() {
         </div>
 
         {/* 右侧：控制与学习 */}
-        <div className="space-y-4">
+        <div className="space-y-4" onPointerDownCapture={handleControlsPointerDown}>
           {/* 样品参数 */}
           <ControlPanel title="样品参数">
             <SliderControl
@@ -660,6 +702,7 @@ export function ChromaticDemo() {
               birefringence={birefringence}
               polarizerAngle={polarizerAngle}
               analyzerAngle={analyzerAngle}
+              step={isDragging ? SPECTRUM_STEP_COARSE : SPECTRUM_STEP_FINE}
             />
             <p className="text-xs text-gray-400 mt-2">
               不同波长的透过率不同，导致出射光呈现特定颜色。
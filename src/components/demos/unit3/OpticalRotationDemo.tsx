@@ -7,7 +7,7 @@
  * - 溶液波动动画效果
  * - 暗色模式文字对比度优化
  */
-import { useState, useMemo } from 'react'
+import { useState, useMemo, useDeferredValue, memo } from 'react'
 import { motion } from 'framer-motion'
 import { SliderControl, ControlPanel, InfoCard } from '../DemoControls'
 import { useTheme } from '@/contexts/ThemeContext'
@@ -61,8 +61,11 @@ function calculateRotation(specificRotation: number, concentration: number, path
 // 光源模式类型
 type LightMode = 'monochromatic' | 'polychromatic'
 
+// 气泡隐藏时的过渡：零时长直接落到静止目标，不再循环
+const BUBBLE_PAUSED_TRANSITION = { duration: 0 }
+
 // 旋光仪光路图
-function OpticalRotationDiagram({
+const OpticalRotationDiagram = memo(function OpticalRotationDiagram({
   substance,
   concentration,
   pathLength,
@@ -89,9 +92,19 @@ function OpticalRotationDiagram({
   const rotationAngle = calculateRotation(specificRotation, concentration, pathLength)
   const isRightRotation = rotationAngle >= 0
 
+  // 旋转弧线终点（弧线与箭头共用，弧度只换算一次）
+  const rotationRad = (rotationAngle * Math.PI) / 180
+  const arcEndX = 25 * Math.sin(rotationRad)
+  const arcEndY = 25 - 25 * Math.cos(rotationRad)
+
   // 检偏器与偏振光的角度差
   const angleDiff = Math.abs(rotationAngle - analyzerAngle)
-  const intensity = Math.pow(Math.cos((angleDiff * Math.PI) / 180), 2)
+  const cosDiff = Math.cos((angleDiff * Math.PI) / 180)
+  const intensity = cosDiff * cosDiff
+
+  // 第一个气泡的随机横向位置只在挂载时取一次，避免每次重渲染都跳动
+  const bubbleX = useMemo(() => -50 + Math.random() * 20, [])
+  const showBubbles = concentration > 0.2
 
   // 多色光模式下计算各波长的旋转角和强度
   const polychromaticData = useMemo(() => {
@@ -100,7 +113,8 @@ function OpticalRotationDiagram({
       const specRot = calculateSpecificRotationAtWavelength(specificRotationD, comp.wavelength)
       const rot = calculateRotation(specRot, concentration, pathLength)
       const diff = Math.abs(rot - analyzerAngle)
-      const inten = Math.pow(Math.cos((diff * Math.PI) / 180), 2)
+      const cosDiff = Math.cos((diff * Math.PI) / 180)
+      const inten = cosDiff * cosDiff
       return {
         ...comp,
         rotation: rot,
@@ -280,56 +294,55 @@ function OpticalRotationDiagram({
           rx="25"
           filter="url(#liquidWave)"
         />
-        {/* 气泡动画 */}
-        {concentration > 0.2 && (
-          <>
-            <motion.circle
-              cx={-50 + Math.random() * 20}
-              cy={10}
-              r={2}
-              fill="url(#bubbleGradient)"
-              animate={{
-                cy: [-15, -25],
-                opacity: [0.6, 0],
-              }}
-              transition={{
-                duration: 2,
-                repeat: Infinity,
-                delay: 0,
-              }}
-            />
-            <motion.circle
-              cx={-20 + pathLength * 30}
-              cy={5}
-              r={3}
-              fill="url(#bubbleGradient)"
-              animate={{
-                cy: [-10, -22],
-                opacity: [0.5, 0],
-              }}
-              transition={{
-                duration: 2.5,
-                repeat: Infinity,
-                delay: 0.8,
-              }}
-            />
-            <motion.circle
-              cx={10 + pathLength * 40}
-              cy={12}
-              r={2.5}
-              fill="url(#bubbleGradient)"
-              animate={{
-                cy: [-8, -20],
-                opacity: [0.7, 0],
-              }}
-              transition={{
-                duration: 1.8,
-                repeat: Infinity,
-                delay: 1.5,
-              }}
-            />
-          </>
-        )}
+        {/* 气泡动画：常驻挂载，浓度跨过阈值时只切换可见性，不反复卸载重建；
+            隐藏时把动画切到零时长的静止目标，停掉无限循环 */}
+        <g visibility={showBubbles ? 'visible' : 'hidden'}>
+          <motion.circle
+            cx={bubbleX}
+            cy={10}
+            r={2}
+            fill="url(#bubbleGradient)"
+            animate={showBubbles ? {
+              cy: [-15, -25],
+              opacity: [0.6, 0],
+            } : { cy: -15, opacity: 0 }}
+            transition={showBubbles ? {
+              duration: 2,
+              repeat: Infinity,
+              delay: 0,
+            } : BUBBLE_PAUSED_TRANSITION}
+          />
+          <motion.circle
+            cx={-20 + pathLength * 30}
+            cy={5}
+            r={3}
+            fill="url(#bubbleGradient)"
+            animate={showBubbles ? {
+              cy: [-10, -22],
+              opacity: [0.5, 0],
+            } : { cy: -10, opacity: 0 }}
+            transition={showBubbles ? {
+              duration: 2.5,
+              repeat: Infinity,
+              delay: 0.8,
+            } : BUBBLE_PAUSED_TRANSITION}
+          />
+          <motion.circle
+            cx={10 + pathLength * 40}
+            cy={12}
+            r={2.5}
+            fill="url(#bubbleGradient)"
+            animate={showBubbles ? {
+              cy: [-8, -20],
+              opacity: [0.7, 0],
+            } : { cy: -8, opacity: 0 }}
+            transition={showBubbles ? {
+              duration: 1.8,
+              repeat: Infinity,
+              delay: 1.5,
+            } : BUBBLE_PAUSED_TRANSITION}
+          />
+        </g>
         {/* 标注 */}
         <text x={(pathLength * 60) / 2} y="50" textAnchor="middle" fill="#67e8f9" fontSize="11">
           样品管 (L={pathLength.toFixed(1)} dm)
@@ -611,7 +624,7 @@ function OpticalRotationDiagram({
       {lightMode === 'monochromatic' && (
         <g transform={`translate(${440 + pathLength * 60}, 90)`}>
           <path
-            d={`M 0 0 A 25 25 0 ${Math.abs(rotationAngle) > 180 ? 1 : 0} ${isRightRotation ? 1 : 0} ${25 * Math.sin((rotationAngle * Math.PI) / 180)} ${25 - 25 * Math.cos((rotationAngle * Math.PI) / 180)}`}
+            d={`M 0 0 A 25 25 0 ${Math.abs(rotationAngle) > 180 ? 1 : 0} ${isRightRotation ? 1 : 0} ${arcEndX} ${arcEndY}`}
             fill="none"
             stroke={lightColor}
             strokeWidth="2"
@@ -620,13 +633,48 @@ function OpticalRotationDiagram({
           <motion.polygon
             points="-4,-8 4,0 -4,8"
             fill={lightColor}
-            transform={`translate(${25 * Math.sin((rotationAngle * Math.PI) / 180)}, ${25 - 25 * Math.cos((rotationAngle * Math.PI) / 180)}) rotate(${rotationAngle + 90})`}
+            transform={`translate(${arcEndX}, ${arcEndY}) rotate(${rotationAngle + 90})`}
           />
         </g>
       )}
     </svg>
   )
-}
+})
+
+// 浓度-旋光角曲线的采样网格（0-1 g/mL，步长0.05）及其横坐标，与物质和光程无关
+const CONCENTRATION_GRID = Float64Array.from({ length: 21 }, (_, i) => i * 0.05)
+const CONCENTRATION_X = CONCENTRATION_GRID.map((c) => 40 + c * 220)
+
+// 浓度-旋光角曲线的静态层：背景、坐标轴、刻度与轴标签，切换物质或调节参数时不重绘
+const RotationChartAxes = memo(function RotationChartAxes() {
+  return (
+    <g>
+      <rect x="40" y="30" width="220" height="100" fill="#1e293b" rx="4" />
+
+      {/* 坐标轴 */}
+      <line x1="40" y1="100" x2="270" y2="100" stroke="#475569" strokeWidth="1" />
+      <line x1="40" y1="30" x2="40" y2="130" stroke="#475569" strokeWidth="1" />
+
+      {/* X轴刻度 */}
+      {[0, 0.5, 1].map((c) => {
+        const x = 40 + c * 220
+        return (
+          <g key={c}>
+            <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
+            <text x={x} y="147" textAnchor="middle" fill="#94a3b8" fontSize="10">{c}</text>
+          </g>
+        )
+      })}
+
+      {/* Y轴原点刻度 */}
+      <text x="30" y="104" textAnchor="end" fill="#94a3b8" fontSize="10">0°</text>
+
+      {/* 轴标签 */}
+      <text x="155" y="158" textAnchor="middle" fill="#94a3b8" fontSize="11">浓度 c (g/mL)</text>
+      <text x="15" y="70" fill="#94a3b8" fontSize="10" transform="rotate(-90 15 70)">α</text>
+    </g>
+  )
+})
 
 // 浓度-旋光角曲线
 function RotationChart({
@@ -643,17 +691,16 @@ function RotationChart({
   const maxRotation = Math.abs(specificRotation * 1.0 * pathLength)
 
   const { pathData } = useMemo(() => {
-    const points: string[] = []
-
-    for (let c = 0; c <= 1; c += 0.05) {
-      const rotation = calculateRotation(specificRotation, c, pathLength)
-      const x = 40 + c * 220
-      const y = 100 - (rotation / maxRotation) * 60
+    // α = [α]·l·c：浓度网格固定，只有标量系数随参数变化
+    const yScale = ((specificRotation * pathLength) / maxRotation) * 60
+    let path = ''
 
-      points.push(`${c === 0 ? 'M' : 'L'} ${x},${y}`)
+    for (let i = 0; i < CONCENTRATION_GRID.length; i++) {
+      const y = 100 - CONCENTRATION_GRID[i] * yScale
+      path += `${i === 0 ? 'M' : ' L'} ${CONCENTRATION_X[i]},${y}`
     }
 
-    return { pathData: points.join(' ') }
+    return { pathData: path }
   }, [specificRotation, pathLength, maxRotation])
 
   const currentRotation = calculateRotation(specificRotation, currentConcentration, pathLength)
@@ -662,25 +709,9 @@ function RotationChart({
 
   return (
     <svg viewBox="0 0 300 160" className="w-full h-auto">
-      <rect x="40" y="30" width="220" height="100" fill="#1e293b" rx="4" />
-
-      {/* 坐标轴 */}
-      <line x1="40" y1="100" x2="270" y2="100" stroke="#475569" strokeWidth="1" />
-      <line x1="40" y1="30" x2="40" y2="130" stroke="#475569" strokeWidth="1" />
-
-      {/* X轴刻度 */}
-      {[0, 0.5, 1].map((c) => {
-        const x = 40 + c * 220
-        return (
-          <g key={c}>
-            <line x1={x} y1="130" x2={x} y2="135" stroke="#94a3b8" strokeWidth="1" />
-            <text x={x} y="147" textAnchor="middle" fill="#94a3b8" fontSize="10">{c}</text>
-          </g>
-        )
-      })}
+      <RotationChartAxes />
 
       {/* Y轴刻度 */}
-      <text x="30" y="104" textAnchor="end" fill="#94a3b8" fontSize="10">0°</text>
       <text x="30" y="44" textAnchor="end" fill="#94a3b8" fontSize="10">
         {isPositive ? '+' : ''}{maxRotation.toFixed(0)}°
       </text>
@@ -702,10 +733,6 @@ function RotationChart({
         animate={{ cx: currentX, cy: currentY }}
         transition={{ duration: 0.2 }}
       />
-
-      {/* 轴标签 */}
-      <text x="155" y="158" textAnchor="middle" fill="#94a3b8" fontSize="11">浓度 c (g/mL)</text>
-      <text x="15" y="70" fill="#94a3b8" fontSize="10" transform="rotate(-90 15 70)">α</text>
     </svg>
   )
 }
@@ -722,6 +749,12 @@ export function OpticalRotationDemo() {
   const [lightMode, setLightMode] = useState<LightMode>('monochromatic')
   const [selectedWavelengthId, setSelectedWavelengthId] = useState('na-d')
 
+  // 光路图（含液体滤镜动画）重绘开销大，交给低优先级渲染：快速拖动滑块时
+  // 只按最新的浓度/光程/检偏角重绘，中间值直接丢弃，读数与曲线仍即时更新
+  const diagramConcentration = useDeferredValue(concentration)
+  const diagramPathLength = useDeferredValue(pathLength)
+  const diagramAnalyzerAngle = useDeferredValue(analyzerAngle)
+
   // 获取选中的光谱线信息
   const selectedSpectralLine = SPECTRAL_LINES.find(l => l.id === selectedWavelengthId) || SPECTRAL_LINES[0]
   const lightColor = selectedSpectralLine.color
@@ -737,7 +770,8 @@ export function OpticalRotationDemo() {
 
   // 透过强度
   const angleDiff = Math.abs(rotationAngle - analyzerAngle)
-  const intensity = Math.pow(Math.cos((angleDiff * Math.PI) / 180), 2)
+  const cosDiff = Math.cos((angleDiff * Math.PI) / 180)
+  const intensity = cosDiff * cosDiff
 
   // 物质选项
   const substances = [
@@ -774,9 +808,9 @@ export function OpticalRotationDemo() {
           <div className="rounded-xl bg-gradient-to-br from-slate-900/90 via-slate-900/95 to-cyan-950/90 border border-cyan-500/30 p-4 shadow-[0_15px_40px_rgba(0,0,0,0.5)]">
             <OpticalRotationDiagram
               substance={substance}
-              concentration={concentration}
-              pathLength={pathLength}
-              analyzerAngle={analyzerAngle}
+              concentration={diagramConcentration}
+              pathLength={diagramPathLength}
+              analyzerAngle={diagramAnalyzerAngle}
               lightMode={lightMode}
               wavelength={wavelength}
               lightColor={lightColor}
@@ -3,30 +3,37 @@
  * 演示粒径远小于波长时的散射特性（蓝天效应）
  * 重新设计：纯 DOM + SVG + Framer Motion
  */
-import { useState, useMemo } from 'react'
+import { useState, useMemo, useDeferredValue, memo } from 'react'
 import { motion } from 'framer-motion'
 import { useTranslation } from 'react-i18next'
 import { SliderControl, ControlPanel, InfoCard, ValueDisplay, Toggle } from '../DemoControls'
 
 // 瑞利散射强度 (与λ^-4成正比)
 function rayleighIntensity(wavelength: number): number {
-  // 归一化到550nm
-  const normalized = Math.pow(550 / wavelength, 4)
-  return Math.min(normalized, 10)
+  // 归一化到550nm；四次方用两次平方代替 Math.pow
+  const ratio = 550 / wavelength
+  const ratioSq = ratio * ratio
+  return Math.min(ratioSq * ratioSq, 10)
 }
 
+// 归一化用的最大强度：强度随波长单调递减，最大值必在最短波长处，直接取常量
+// 波长曲线从400nm起，柱状图最短为450nm（蓝光）
+const CURVE_MAX_INTENSITY = rayleighIntensity(400)
+const BAR_MAX_INTENSITY = rayleighIntensity(450)
+
 // 瑞利散射相函数 (exported for future use)
 export function rayleighPhaseFunction(theta: number): number {
   // I ∝ (1 + cos²θ)
-  return (3 / 16 / Math.PI) * (1 + Math.pow(Math.cos(theta), 2))
+  const c = Math.cos(theta)
+  return (3 / 16 / Math.PI) * (1 + c * c)
 }
 
 // 偏振度
 function rayleighPolarization(theta: number): number {
-  // 偏振度 = sin²θ / (1 + cos²θ)
-  const sinSq = Math.pow(Math.sin(theta), 2)
-  const cosSq = Math.pow(Math.cos(theta), 2)
-  return sinSq / (1 + cosSq)
+  // 偏振度 = sin²θ / (1 + cos²θ)，sin²θ 由 1 - cos²θ 得到，只需一次三角函数
+  const c = Math.cos(theta)
+  const cosSq = c * c
+  return (1 - cosSq) / (1 + cosSq)
 }
 
 // 波长到RGB
@@ -55,27 +62,54 @@ function wavelengthToRGB(wavelength: number): string {
   return `rgb(${Math.round(R * 255)}, ${Math.round(G * 255)}, ${Math.round(B * 255)})`
 }
 
+// 正午天空颜色（常量）
+const NOON_SKY_COLOR = 'rgb(100, 180, 255)'
+
 // 计算天空颜色（基于太阳角度）
 function getSkyColor(sunAngle: number): string {
   // 太阳低时，光线穿过更多大气，蓝光散射殆尽，呈现橙红色
   // 太阳高时，天空呈现蓝色
-  const factor = sunAngle / 90 // 0-1
+  // 正午区间（≥45°）直接返回常量，不做任何运算
+  if (sunAngle >= 45) return NOON_SKY_COLOR
+
+  const factor = sunAngle * (1 / 90) // 0-0.5
 
   if (factor < 0.2) {
     // 日出/日落 - 橙红色
-    return `rgb(${255}, ${Math.round(100 + factor * 200)}, ${Math.round(factor * 255)})`
-  } else if (factor < 0.5) {
-    // 早晨/傍晚 - 渐变到蓝色
-    const t = (factor - 0.2) / 0.3
-    return `rgb(${Math.round(255 * (1 - t))}, ${Math.round(150 + 50 * t)}, ${Math.round(200 + 55 * t)})`
-  } else {
-    // 正午 - 蓝色
-    return 'rgb(100, 180, 255)'
+    return `rgb(255, ${Math.round(100 + factor * 200)}, ${Math.round(factor * 255)})`
   }
+
+  // 早晨/傍晚 - 渐变到蓝色
+  const t = (factor - 0.2) * (1 / 0.3)
+  return `rgb(${Math.round(255 - 255 * t)}, ${Math.round(150 + 50 * t)}, ${Math.round(200 + 55 * t)})`
 }
 
+// 散射光线（不同波长）：方向、长度、颜色都与滑块无关，模块加载时一次算好，
+// 存为相对散射点的偏移，渲染时只做加法
+const SCATTERED_RAYS = (() => {
+  const wavelengths = [450, 480, 510, 550, 600, 650]
+  const angles = [-60, -40, -20, 0, 20, 40, 60, 80, 100, 120]
+
+  return angles.map((angle, i) => {
+    const wl = wavelengths[i % wavelengths.length]
+    const intensity = rayleighIntensity(wl)
+    const rad = angle * Math.PI / 180
+    const length = 30 + intensity * 5
+
+    return {
+      wl,
+      dx: length * Math.cos(rad),
+      dy: -length * Math.sin(rad),
+      color: wavelengthToRGB(wl),
+      opacity: 0.3 + intensity / 10,
+      width: 1 + intensity / 3,
+      delay: i * 0.1,
+    }
+  })
+})()
+
 // 瑞利散射场景图
-function RayleighDiagram({
+const RayleighDiagram = memo(function RayleighDiagram({
   sunAngle,
   observerAngle,
   showPolarization,
@@ -91,8 +125,10 @@ function RayleighDiagram({
 
   // 太阳位置
   const sunDistance = 180
-  const sunX = centerX + sunDistance * Math.cos((180 - sunAngle) * Math.PI / 180)
-  const sunY = groundY - sunDistance * Math.sin(sunAngle * Math.PI / 180)
+  // cos(180° - α) = -cos α，弧度只换算一次
+  const sunRad = sunAngle * Math.PI / 180
+  const sunX = centerX - sunDistance * Math.cos(sunRad)
+  const sunY = groundY - sunDistance * Math.sin(sunRad)
 
   // 散射点（大气中）
   const scatterX = centerX
@@ -104,8 +140,9 @@ function RayleighDiagram({
 
   // 观察方向终点
   const obsDistance = 100
-  const obsEndX = observerX + obsDistance * Math.cos((180 - observerAngle) * Math.PI / 180)
-  const obsEndY = observerY - obsDistance * Math.sin(observerAngle * Math.PI / 180)
+  const observerRad = observerAngle * Math.PI / 180
+  const obsEndX = observerX - obsDistance * Math.cos(observerRad)
+  const obsEndY = observerY - obsDistance * Math.sin(observerRad)
 
   // 散射角
   const scatterAngle = 180 - Math.abs(sunAngle - observerAngle)
@@ -127,31 +164,6 @@ function RayleighDiagram({
     return result
   }, [])
 
-  // 散射光线（不同波长）
-  const scatteredRays = useMemo(() => {
-    const rays: { wl: number; endX: number; endY: number; color: string; opacity: number; width: number; delay: number }[] = []
-    const wavelengths = [450, 480, 510, 550, 600, 650]
-    const angles = [-60, -40, -20, 0, 20, 40, 60, 80, 100, 120]
-
-    angles.forEach((angle, i) => {
-      const wl = wavelengths[i % wavelengths.length]
-      const intensity = rayleighIntensity(wl)
-      const rad = angle * Math.PI / 180
-      const length = 30 + intensity * 5
-
-      rays.push({
-        wl,
-        endX: scatterX + length * Math.cos(rad),
-        endY: scatterY - length * Math.sin(rad),
-        color: wavelengthToRGB(wl),
-        opacity: 0.3 + intensity / 10,
-        width: 1 + intensity / 3,
-        delay: i * 0.1,
-      })
-    })
-    return rays
-  }, [scatterX, scatterY])
-
   return (
     <svg viewBox={`0 0 ${width} ${height}`} className="w-full h-full">
       <defs>
@@ -242,13 +254,13 @@ function RayleighDiagram({
       />
 
       {/* 散射光线 */}
-      {scatteredRays.map((ray, i) => (
+      {SCATTERED_RAYS.map((ray, i) => (
         <motion.line
           key={i}
           x1={scatterX}
           y1={scatterY}
-          x2={ray.endX}
-          y2={ray.endY}
+          x2={scatterX + ray.dx}
+          y2={scatterY + ray.dy}
           stroke={ray.color}
           strokeWidth={ray.width}
           strokeLinecap="round"
@@ -358,31 +370,39 @@ function RayleighDiagram({
       </text>
     </svg>
   )
+})
+
+// 小图表尺寸（波长依赖性图与偏振度图共用）
+const SMALL_CHART = {
+  width: 280,
+  height: 150,
+  margin: { left: 45, right: 15, top: 20, bottom: 35 },
 }
 
-// 波长依赖性曲线图
-function WavelengthDependenceChart() {
-  const width = 280
-  const height = 150
-  const margin = { left: 45, right: 15, top: 20, bottom: 35 }
+// 曲线采样网格与参数无关，只生成一次
+// 网格值都是整数，Float32 可精确表示，占用减半（坐标计算仍以双精度进行）
+// 波长 400-700nm，步长5nm
+const WAVELENGTH_GRID = Float32Array.from({ length: 61 }, (_, i) => 400 + i * 5)
+// 散射角 0°-180°，步长2°
+const SCATTER_ANGLE_GRID = Float32Array.from({ length: 91 }, (_, i) => i * 2)
+
+// 波长依赖性曲线图（无参数，父组件随滑块重渲染时直接复用）
+const WavelengthDependenceChart = memo(function WavelengthDependenceChart() {
+  const { width, height, margin } = SMALL_CHART
   const chartWidth = width - margin.left - margin.right
   const chartHeight = height - margin.top - margin.bottom
 
   // 生成曲线路径
   const curvePath = useMemo(() => {
-    const maxIntensity = rayleighIntensity(400)
     let d = ''
 
-    for (let wl = 400; wl <= 700; wl += 5) {
+    for (let i = 0; i < WAVELENGTH_GRID.length; i++) {
+      const wl = WAVELENGTH_GRID[i]
       const intensity = rayleighIntensity(wl)
       const x = margin.left + ((wl - 400) / 300) * chartWidth
-      const y = margin.top + (1 - intensity / maxIntensity) * chartHeight * 0.9
+      const y = margin.top + (1 - intensity / CURVE_MAX_INTENSITY) * chartHeight * 0.9
 
-      if (wl === 400) {
-        d += `M ${x} ${y}`
-      } else {
-        d += ` L ${x} ${y}`
-      }
+      d += `${i === 0 ? 'M' : ' L'} ${x} ${y}`
     }
     return d
   }, [chartWidth, chartHeight, margin])
@@ -394,8 +414,6 @@ function WavelengthDependenceChart() {
     { wl: 650, label: '红' },
   ]
 
-  const maxIntensity = rayleighIntensity(400)
-
   return (
     <svg viewBox={`0 0 ${width} ${height}`} className="w-full">
       {/* 背景 */}
@@ -466,7 +484,7 @@ function WavelengthDependenceChart() {
       {keyPoints.map((point, i) => {
         const intensity = rayleighIntensity(point.wl)
         const x = margin.left + ((point.wl - 400) / 300) * chartWidth
-        const y = margin.top + (1 - intensity / maxIntensity) * chartHeight * 0.9
+        const y = margin.top + (1 - intensity / CURVE_MAX_INTENSITY) * chartHeight * 0.9
 
         return (
           <motion.g key={i} initial={{ scale: 0 }} animate={{ scale: 1 }} transition={{ delay: 1 + i * 0.2 }}>
@@ -484,13 +502,11 @@ function WavelengthDependenceChart() {
       </text>
     </svg>
   )
-}
+})
 
-// 偏振度vs散射角图表
-function PolarizationAngleChart({ currentAngle }: { currentAngle: number }) {
-  const width = 280
-  const height = 150
-  const margin = { left: 45, right: 15, top: 20, bottom: 35 }
+// 偏振度vs散射角图表的静态层：坐标轴、标注与偏振度曲线，不随散射角变化
+const PolarizationAngleChartBackground = memo(function PolarizationAngleChartBackground() {
+  const { width, height, margin } = SMALL_CHART
   const chartWidth = width - margin.left - margin.right
   const chartHeight = height - margin.top - margin.bottom
 
@@ -498,32 +514,23 @@ function PolarizationAngleChart({ currentAngle }: { currentAngle: number }) {
   const curvePath = useMemo(() => {
     let d = ''
 
-    for (let angle = 0; angle <= 180; angle += 2) {
+    for (let i = 0; i < SCATTER_ANGLE_GRID.length; i++) {
+      const angle = SCATTER_ANGLE_GRID[i]
       const rad = angle * Math.PI / 180
       const pol = rayleighPolarization(rad)
       const x = margin.left + (angle / 180) * chartWidth
       const y = margin.top + (1 - pol) * chartHeight
 
-      if (angle === 0) {
-        d += `M ${x} ${y}`
-      } else {
-        d += ` L ${x} ${y}`
-      }
+      d += `${i === 0 ? 'M' : ' L'} ${x} ${y}`
     }
     return d
   }, [chartWidth, chartHeight, margin])
 
-  // 当前点
-  const currentRad = currentAngle * Math.PI / 180
-  const currentPol = rayleighPolarization(currentRad)
-  const currentX = margin.left + (currentAngle / 180) * chartWidth
-  const currentY = margin.top + (1 - currentPol) * chartHeight
-
   // 90度线位置
   const x90 = margin.left + 0.5 * chartWidth
 
   return (
-    <svg viewBox={`0 0 ${width} ${height}`} className="w-full">
+    <g>
       {/* 背景 */}
       <rect x={0} y={0} width={width} height={height} fill="#0f172a" rx={8} />
 
@@ -581,6 +588,25 @@ function PolarizationAngleChart({ currentAngle }: { currentAngle: number }) {
         animate={{ pathLength: 1 }}
         transition={{ duration: 1.5, ease: 'easeOut' }}
       />
+    </g>
+  )
+})
+
+// 偏振度vs散射角图表
+function PolarizationAngleChart({ currentAngle }: { currentAngle: number }) {
+  const { width, height, margin } = SMALL_CHART
+  const chartWidth = width - margin.left - margin.right
+  const chartHeight = height - margin.top - margin.bottom
+
+  // 当前点
+  const currentRad = currentAngle * Math.PI / 180
+  const currentPol = rayleighPolarization(currentRad)
+  const currentX = margin.left + (currentAngle / 180) * chartWidth
+  const currentY = margin.top + (1 - currentPol) * chartHeight
+
+  return (
+    <svg viewBox={`0 0 ${width} ${height}`} className="w-full">
+      <PolarizationAngleChartBackground />
 
       {/* 当前角度点 */}
       <motion.circle
@@ -606,20 +632,18 @@ function PolarizationAngleChart({ currentAngle }: { currentAngle: number }) {
 }
 
 // 散射强度对比柱状图
-function ScatteringIntensityBars() {
+const ScatteringIntensityBars = memo(function ScatteringIntensityBars() {
   const wavelengths = [
     { wl: 450, label: '蓝光', color: '#3b82f6' },
     { wl: 550, label: '绿光', color: '#22c55e' },
     { wl: 650, label: '红光', color: '#ef4444' },
   ]
 
-  const maxIntensity = rayleighIntensity(450)
-
   return (
     <div className="space-y-3">
       {wavelengths.map((item, i) => {
         const intensity = rayleighIntensity(item.wl)
-        const percentage = (intensity / maxIntensity) * 100
+        const percentage = (intensity / BAR_MAX_INTENSITY) * 100
 
         return (
           <div key={i} className="space-y-1">
@@ -644,7 +668,7 @@ function ScatteringIntensityBars() {
       </p>
     </div>
   )
-}
+})
 
 // 主演示组件
 export function RayleighScatteringDemo() {
@@ -653,6 +677,11 @@ export function RayleighScatteringDemo() {
   const [observerAngle, setObserverAngle] = useState(45)
   const [showPolarization, setShowPolarization] = useState(true)
 
+  // 场景图交给低优先级渲染：快速拖动角度滑块时只按最新角度重绘，
+  // 中间值直接丢弃，偏振度读数与曲线标记仍即时更新
+  const sceneSunAngle = useDeferredValue(sunAngle)
+  const sceneObserverAngle = useDeferredValue(observerAngle)
+
   // 散射角
   const scatterAngle = 180 - Math.abs(sunAngle - observerAngle)
   const scatterRad = scatterAngle * Math.PI / 180
@@ -686,8 +715,8 @@ export function RayleighScatteringDemo() {
             <h3 className="text-sm font-medium text-cyan-400 mb-3">大气散射场景</h3>
             <div className="aspect-[16/10]">
               <RayleighDiagram
-                sunAngle={sunAngle}
-                observerAngle={observerAngle}
+                sunAngle={sceneSunAngle}
+                observerAngle={sceneObserverAngle}
                 showPolarization={showPolarization}
               />
             </div>
@@ -72,17 +72,38 @@ export function cosineFit(data: DataPoint[]): FitResult | null {
   const toRad = (deg: number) => deg * Math.PI / 180
 
   // Model function: I = amplitude * cos²(θ - phase) + offset
-  const model = (angle: number, amp: number, phase: number, offset: number) => {
-    const theta = toRad(angle - phase)
-    return amp * Math.cos(theta) ** 2 + offset
+  // Double-angle expansion: cos²(θ - φ) = [1 + cos2θ·cos2φ + sin2θ·sin2φ] / 2
+  // cos2θ/sin2θ of the data points are computed once; each residual evaluation
+  // then needs only one sine/cosine of the phase
+  const n = data.length
+  const cos2Theta = new Float64Array(n)
+  const sin2Theta = new Float64Array(n)
+  for (let i = 0; i < n; i++) {
+    const twoTheta = 2 * toRad(data[i].angle)
+    cos2Theta[i] = Math.cos(twoTheta)
+    sin2Theta[i] = Math.sin(twoTheta)
   }
 
-  // Calculate sum of squared residuals
+  const predictAll = (amp: number, phase: number, offset: number, out: Float64Array) => {
+    const twoPhase = 2 * toRad(phase)
+    const cos2Phase = Math.cos(twoPhase)
+    const sin2Phase = Math.sin(twoPhase)
+    const halfAmp = amp * 0.5
+    for (let i = 0; i < n; i++) {
+      out[i] = halfAmp * (1 + cos2Theta[i] * cos2Phase + sin2Theta[i] * sin2Phase) + offset
+    }
+  }
+
+  // Calculate sum of squared residuals (prediction buffer is reused across calls)
+  const predicted = new Float64Array(n)
   const ssr = (amp: number, phase: number, offset: number) => {
-    return data.reduce((sum, p) => {
-      const pred = model(p.angle, amp, phase, offset)
-      return sum + (p.intensity - pred) ** 2
-    }, 0)
+    predictAll(amp, phase, offset, predicted)
+    let sum = 0
+    for (let i = 0; i < n; i++) {
+      const r = data[i].intensity - predicted[i]
+      sum += r * r
+    }
+    return sum
   }
 
   // Initial guesses from data statistics
@@ -138,12 +159,13 @@ export function cosineFit(data: DataPoint[]): FitResult | null {
   const residuals: number[] = []
   let ssTot = 0, ssRes = 0
 
-  for (const point of data) {
-    const predicted = model(point.angle, amplitude, phase, offset)
-    modelValues.push(predicted)
-    residuals.push(point.intensity - predicted)
+  predictAll(amplitude, phase, offset, predicted)
+  for (let i = 0; i < n; i++) {
+    const point = data[i]
+    modelValues.push(predicted[i])
+    residuals.push(point.intensity - predicted[i])
     ssTot += (point.intensity - meanI) ** 2
-    ssRes += (point.intensity - predicted) ** 2
+    ssRes += (point.intensity - predicted[i]) ** 2
   }
 
   const rSquared = ssTot > 0 ? Math.max(0, 1 - ssRes / ssTot) : 0
@@ -232,19 +232,20 @@ export function analyzePolarization(jones: JonesVector): {
   const ex = jones[0]
   const ey = jones[1]
 
-  const exAbs = complex.abs(ex)
-  const eyAbs = complex.abs(ey)
-  const delta = complex.phase(ey) - complex.phase(ex)
-
-  // Calculate Stokes parameters (normalized)
-  const intensity = exAbs * exAbs + eyAbs * eyAbs
+  // Calculate Stokes parameters (normalized) straight from the components:
+  // Ex*·Ey = |Ex||Ey|e^(iδ), so 2·Re and 2·Im of it give S2 and S3
+  // without taking magnitudes, phases, or cos/sin of δ
+  const exAbs2 = ex.re * ex.re + ex.im * ex.im
+  const eyAbs2 = ey.re * ey.re + ey.im * ey.im
+  const intensity = exAbs2 + eyAbs2
   if (intensity < 1e-10) {
     return { type: 'linear', ellipticity: 0, orientation: 0, handedness: 'none' }
   }
 
-  const s1 = (exAbs * exAbs - eyAbs * eyAbs) / intensity // cos(2ψ)cos(2χ)
-  const s2 = (2 * exAbs * eyAbs * Math.cos(delta)) / intensity // sin(2ψ)cos(2χ)
-  const s3 = (2 * exAbs * eyAbs * Math.sin(delta)) / intensity // sin(2χ)
+  const invIntensity = 1 / intensity
+  const s1 = (exAbs2 - eyAbs2) * invIntensity // cos(2ψ)cos(2χ)
+  const s2 = 2 * (ex.re * ey.re + ex.im * ey.im) * invIntensity // sin(2ψ)cos(2χ)
+  const s3 = 2 * (ex.re * ey.im - ex.im * ey.re) * invIntensity // sin(2χ)
 
   // Calculate ellipticity angle χ
   const chi = 0.5 * Math.asin(Math.max(-1, Math.min(1, s3)))
@@ -368,6 +369,106 @@ export function identityMatrix(): JonesMatrix {
   ]
 }
 
+// ============================================
+// Batch Propagation
+// ============================================
+
+/**
+ * N Jones vectors stored as separate real/imaginary component arrays
+ * (structure of arrays), used to push many input states through one stack.
+ */
+export interface JonesVectorBatch {
+  exRe: Float64Array
+  exIm: Float64Array
+  eyRe: Float64Array
+  eyIm: Float64Array
+}
+
+/**
+ * Allocate a zeroed batch of `count` Jones vectors
+ */
+export function createJonesVectorBatch(count: number): JonesVectorBatch {
+  return {
+    exRe: new Float64Array(count),
+    exIm: new Float64Array(count),
+    eyRe: new Float64Array(count),
+    eyIm: new Float64Array(count),
+  }
+}
+
+/**
+ * Propagate every vector of a batch through a stack of elements:
+ * output[i] = M_last × … × M_first × input[i]
+ *
+ * Each state is kept in local scalars while it walks the element list, so
+ * no intermediate Complex objects are allocated. `output` may be `input`
+ * for in-place propagation.
+ * @param input - Input states
+ * @param matrices - Elements in the order light passes through them
+ * @param output - Destination batch (same length as input)
+ */
+export function propagateJonesBatch(
+  input: JonesVectorBatch,
+  matrices: readonly JonesMatrix[],
+  output: JonesVectorBatch
+): JonesVectorBatch {
+  const { exRe, exIm, eyRe, eyIm } = input
+  const count = exRe.length
+  const stages = matrices.length
+
+  for (let i = 0; i < count; i++) {
+    let xr = exRe[i]
+    let xi = exIm[i]
+    let yr = eyRe[i]
+    let yi = eyIm[i]
+
+    for (let k = 0; k < stages; k++) {
+      const [[a, b], [c, d]] = matrices[k]
+      const nxr = a.re * xr - a.im * xi + b.re * yr - b.im * yi
+      const nxi = a.re * xi + a.im * xr + b.re * yi + b.im * yr
+      const nyr = c.re * xr - c.im * xi + d.re * yr - d.im * yi
+      const nyi = c.re * xi + c.im * xr + d.re * yi + d.im * yr
+      xr = nxr
+      xi = nxi
+      yr = nyr
+      yi = nyi
+    }
+
+    output.exRe[i] = xr
+    output.exIm[i] = xi
+    output.eyRe[i] = yr
+    output.eyIm[i] = yi
+  }
+
+  return output
+}
+
+// ============================================
+// Angle-keyed Matrix Cache
+// ============================================
+
+/** Maximum number of cached matrices per element type */
+const MATRIX_CACHE_SIZE = 4096
+
+/**
+ * Memoize a matrix factory by its angle argument.
+ * Slider-driven callers and per-frame light tracing request the same element
+ * angle over and over; the cache is cleared wholesale once it fills up.
+ * Cached matrices are shared between callers and must not be mutated.
+ */
+function cacheByAngle(build: (angleDeg: number) => JonesMatrix): (angleDeg: number) => JonesMatrix {
+  const cache = new Map<number, JonesMatrix>()
+  return (angleDeg: number) => {
+    let matrix = cache.get(angleDeg)
+    if (matrix === undefined) {
+      if (cache.size >= MATRIX_CACHE_SIZE) cache.clear()
+      matrix = build(angleDeg)
+      cache.set(angleDeg, matrix)
+    }
+    return matrix
+  }
+}
+
 // ============================================
 // Standard Optical Element Jones Matrices
 // ============================================
@@ -376,7 +477,7 @@ export function identityMatrix(): JonesMatrix {
  * Linear polarizer at angle θ
  * @param angleDeg - Transmission axis angle in degrees
  */
-export function polarizerMatrix(angleDeg: number): JonesMatrix {
+function buildPolarizerMatrix(angleDeg: number): JonesMatrix {
   const theta = (angleDeg * Math.PI) / 180
   const c = Math.cos(theta)
   const s = Math.sin(theta)
@@ -386,12 +487,18 @@ export function polarizerMatrix(angleDeg: number): JonesMatrix {
   ]
 }
 
+/**
+ * Linear polarizer at angle θ (cached by angle)
+ * @param angleDeg - Transmission axis angle in degrees
+ */
+export const polarizerMatrix = cacheByAngle(buildPolarizerMatrix)
+
 /**
  * Half-wave plate (λ/2) with fast axis at angle θ
  * Introduces π phase retardation, flips polarization about fast axis
  * @param fastAxisDeg - Fast axis angle in degrees
  */
-export function halfWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
+function buildHalfWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
   const theta = (fastAxisDeg * Math.PI) / 180
   const c2 = Math.cos(2 * theta)
   const s2 = Math.sin(2 * theta)
@@ -407,7 +514,7 @@ export function halfWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
  * Introduces π/2 phase retardation, converts linear ↔ circular
  * @param fastAxisDeg - Fast axis angle in degrees
  */
-export function quarterWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
+function buildQuarterWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
   const theta = (fastAxisDeg * Math.PI) / 180
   const c = Math.cos(theta)
   const s = Math.sin(theta)
@@ -429,6 +536,37 @@ export function quarterWavePlateMatrix(fastAxisDeg: number): JonesMatrix {
   ]
 }
 
+/**
+ * Half-wave plate (λ/2) with fast axis at angle θ (cached by angle)
+ * @param fastAxisDeg - Fast axis angle in degrees
+ */
+export const halfWavePlateMatrix = cacheByAngle(buildHalfWavePlateMatrix)
+
+/**
+ * Quarter-wave plate (λ/4) with fast axis at angle θ (cached by angle)
+ * @param fastAxisDeg - Fast axis angle in degrees
+ */
+export const quarterWavePlateMatrix = cacheByAngle(buildQuarterWavePlateMatrix)
+
+/**
+ * Apply a half-wave plate directly: output = HWP(θ) × input
+ * The HWP matrix [[cos2θ, sin2θ], [sin2θ, -cos2θ]] is purely real, so each
+ * output component is a real linear combination of the inputs. This needs
+ * 8 real multiplies instead of the 16 of a general complex 2×2 product.
+ * @param fastAxisDeg - Fast axis angle in degrees
+ * @param vec - Input Jones vector
+ */
+export function applyHalfWavePlate(fastAxisDeg: number, vec: JonesVector): JonesVector {
+  const matrix = halfWavePlateMatrix(fastAxisDeg)
+  const c2 = matrix[0][0].re
+  const s2 = matrix[0][1].re
+  const [ex, ey] = vec
+  return [
+    complex.create(c2 * ex.re + s2 * ey.re, c2 * ex.im + s2 * ey.im),
+    complex.create(s2 * ex.re - c2 * ey.re, s2 * ex.im - c2 * ey.im),
+  ]
+}
+
 /**
  * General retarder (waveplate) with arbitrary retardation
  *
@@ -477,7 +615,7 @@ export function retarderMatrix(
  * Rotates polarization plane by angle θ without changing ellipticity
  * @param angleDeg - Rotation angle in degrees
  */
-export function rotatorMatrix(angleDeg: number): JonesMatrix {
+function buildRotatorMatrix(angleDeg: number): JonesMatrix {
   const theta = (angleDeg * Math.PI) / 180
   const c = Math.cos(theta)
   const s = Math.sin(theta)
@@ -487,6 +625,12 @@ export function rotatorMatrix(angleDeg: number): JonesMatrix {
   ]
 }
 
+/**
+ * Optical rotator with rotation angle θ (cached by angle)
+ * @param angleDeg - Rotation angle in degrees
+ */
+export const rotatorMatrix = cacheByAngle(buildRotatorMatrix)
+
 /**
  * Partial polarizer (dichroic element) with different transmission for axes
  * @param transmissionX - Amplitude transmission for x-axis (0-1)
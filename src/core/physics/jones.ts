@@ -19,6 +19,7 @@ export {
   type JonesVector,
   type JonesMatrix,
   type OpticalElementType,
+  type JonesVectorBatch,
 
   // Complex number operations
   complex,
@@ -34,6 +35,9 @@ export {
 
   // Jones matrix operations
   applyJonesMatrix,
+  applyHalfWavePlate,
+  createJonesVectorBatch,
+  propagateJonesBatch,
   multiplyJonesMatrices,
   identityMatrix,
 
@@ -366,14 +370,23 @@ export function checkSensorMatch(
     return { matches: true, fidelity: 1, intensity }
   }
 
-  // Create target Jones vector for comparison
-  const target = polarizationToJonesVector(requiredPolarization)
-  const fidelity = polarizationFidelity(received, target)
+  // Fidelity against the linear target state [cos θ, sin θ], computed in place:
+  // the target is real and unit-length, so ⟨target|received⟩ = cos θ·Ex + sin θ·Ey
+  // and only the received intensity is needed to normalize. This avoids building
+  // and normalizing two Jones vectors per sensor check.
+  const targetRad = (requiredPolarization * Math.PI) / 180
+  const tc = Math.cos(targetRad)
+  const ts = Math.sin(targetRad)
+  const overlapRe = tc * received[0].re + ts * received[1].re
+  const overlapIm = tc * received[0].im + ts * received[1].im
+  const fidelity =
+    intensity < 1e-10 ? 0 : (overlapRe * overlapRe + overlapIm * overlapIm) / intensity
 
   // Calculate angular tolerance in terms of fidelity
   // cos²(θ) where θ is the angular difference
   const toleranceRad = (toleranceDeg * Math.PI) / 180
-  const minFidelity = Math.pow(Math.cos(toleranceRad), 2)
+  const toleranceCos = Math.cos(toleranceRad)
+  const minFidelity = toleranceCos * toleranceCos
 
   return {
     matches: fidelity >= minFidelity,
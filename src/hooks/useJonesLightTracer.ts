@@ -31,9 +31,9 @@ import {
   jonesVectorToPolarization,
   jonesIntensity,
   applyJonesMatrix,
+  applyHalfWavePlate,
   polarizerMatrix,
   rotatorMatrix,
-  halfWavePlateMatrix,
   quarterWavePlateMatrix,
   retarderMatrix,
   splitByBirefringence,
@@ -405,8 +405,7 @@ function processComponentInteraction(
     case 'halfWavePlate': {
       // λ/2 plate: flips polarization about fast axis
       const fastAxis = compState.angle ?? 0
-      const matrix = halfWavePlateMatrix(fastAxis)
-      const outputJones = applyJonesMatrix(matrix, inputJones)
+      const outputJones = applyHalfWavePlate(fastAxis, inputJones)
       const attenuatedJones = scaleJonesIntensity(outputJones, ctx.config.wavePlateLoss)
 
       traceLightPathJones(
@@ -659,8 +658,7 @@ function processComponentInteraction(
         }
         case 'halfWavePlate': {
           // Hidden λ/2 plate
-          const matrix = halfWavePlateMatrix(hiddenAngle)
-          outputJones = applyJonesMatrix(matrix, inputJones)
+          outputJones = applyHalfWavePlate(hiddenAngle, inputJones)
           break
         }
         case 'quarterWavePlate': {
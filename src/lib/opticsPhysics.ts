@@ -1,6 +1,6 @@
 /**
  * Optics Physics - 光学物理计算库
- * 包含马吕斯定律、双折射分光、镜面反射等核心物理计算
+ * 包含马吕斯定律、双折射分光、镜面反射、菲涅尔反射等核心物理计算
  * 可在2D游戏、3D游戏和课程Demo中复用
  */
 
@@ -37,8 +37,8 @@ export function applyMalusLaw(
   filterAngle: number
 ): number {
   const angleDiff = Math.abs(inputPolarization - filterAngle) % 180
-  const transmission = Math.cos((angleDiff * Math.PI) / 180) ** 2
-  return inputIntensity * transmission
+  const c = Math.cos((angleDiff * Math.PI) / 180)
+  return inputIntensity * c * c
 }
 
 /**
@@ -52,7 +52,8 @@ export function getMalusTransmission(
   filterAngle: number
 ): number {
   const angleDiff = Math.abs(inputPolarization - filterAngle) % 180
-  return Math.cos((angleDiff * Math.PI) / 180) ** 2
+  const c = Math.cos((angleDiff * Math.PI) / 180)
+  return c * c
 }
 
 /**
@@ -67,9 +68,11 @@ export function splitByBirefringence(
   inputPolarization: number
 ): { oRayIntensity: number; eRayIntensity: number } {
   // o光沿原方向传播，偏振角度为0°
-  const oRayIntensity = inputIntensity * Math.cos((inputPolarization * Math.PI) / 180) ** 2
+  const cosO = Math.cos((inputPolarization * Math.PI) / 180)
+  const oRayIntensity = inputIntensity * cosO * cosO
   // e光偏折，偏振角度为90°
-  const eRayIntensity = inputIntensity * Math.cos(((inputPolarization - 90) * Math.PI) / 180) ** 2
+  const cosE = Math.cos(((inputPolarization - 90) * Math.PI) / 180)
+  const eRayIntensity = inputIntensity * cosE * cosE
 
   return { oRayIntensity, eRayIntensity }
 }
@@ -224,6 +227,117 @@ export function combineIntensities(
   return totalAmplitude ** 2
 }
 
+/**
+ * 入射角采样表 - 采样角及其正弦/余弦
+ * 反射率曲线只随折射率变化，三角函数部分建表一次即可在各次扫描间复用
+ */
+export interface AngleTrigTable {
+  anglesDeg: Float64Array
+  sin: Float64Array
+  cos: Float64Array
+}
+
+/**
+ * 为一组入射角建立正弦/余弦表
+ * @param anglesDeg 入射角采样（度）
+ * @returns 采样角三角函数表
+ */
+export function createAngleTrigTable(anglesDeg: Float64Array): AngleTrigTable {
+  const sin = new Float64Array(anglesDeg.length)
+  const cos = new Float64Array(anglesDeg.length)
+  for (let i = 0; i < anglesDeg.length; i++) {
+    const rad = (anglesDeg[i] * Math.PI) / 180
+    sin[i] = Math.sin(rad)
+    cos[i] = Math.cos(rad)
+  }
+  return { anglesDeg, sin, cos }
+}
+
+/**
+ * 菲涅尔扫描输出缓冲区 - 每个分量一段连续的类型化数组
+ */
+export interface FresnelSweepBuffers {
+  Rs: Float64Array
+  Rp: Float64Array
+}
+
+/**
+ * 分配菲涅尔扫描输出缓冲区
+ * @param count 采样点数
+ * @returns 输出缓冲区
+ */
+export function createFresnelSweepBuffers(count: number): FresnelSweepBuffers {
+  return {
+    Rs: new Float64Array(count),
+    Rp: new Float64Array(count),
+  }
+}
+
+/**
+ * 菲涅尔反射率扫描 - 批量计算一组入射角下的 s/p 偏振反射率
+ * 循环内不调用三角函数、不分配对象；全内反射通过钳制 cosθ₂ = 0 无分支处理（此时 R = 1）
+ * @param trig 入射角采样表（cosθ₁ 需大于 0）
+ * @param n1 入射介质折射率
+ * @param n2 透射介质折射率
+ * @param out 输出缓冲区，长度不小于采样点数
+ */
+export function fresnelReflectanceSweep(
+  trig: AngleTrigTable,
+  n1: number,
+  n2: number,
+  out: FresnelSweepBuffers
+): void {
+  // 最常见的情形是光从空气入射（n₁ = 1），走特化版本
+  if (n1 === 1) {
+    fresnelReflectanceSweepFromAir(trig, n2, out)
+    return
+  }
+
+  const { sin: sinTheta1, cos: cosTheta1 } = trig
+  const { Rs, Rp } = out
+  // 折射率比在循环外算好，循环内只做乘法
+  const ratio = n1 / n2
+
+  for (let i = 0; i < sinTheta1.length; i++) {
+    const c1 = cosTheta1[i]
+    const sinTheta2 = ratio * sinTheta1[i]
+    const cosTheta2 = Math.sqrt(Math.max(0, 1 - sinTheta2 * sinTheta2))
+    // 分子分母共用的乘积各算一次
+    const n1c1 = n1 * c1
+    const n2c2 = n2 * cosTheta2
+    const n2c1 = n2 * c1
+    const n1c2 = n1 * cosTheta2
+    const rs = (n1c1 - n2c2) / (n1c1 + n2c2)
+    const rp = (n2c1 - n1c2) / (n2c1 + n1c2)
+    Rs[i] = rs * rs
+    Rp[i] = rp * rp
+  }
+}
+
+// n₁ = 1 时的特化扫描：公式中的 n₁ 乘法全部消去
+function fresnelReflectanceSweepFromAir(
+  trig: AngleTrigTable,
+  n2: number,
+  out: FresnelSweepBuffers
+): void {
+  const { sin: sinTheta1, cos: cosTheta1 } = trig
+  const { Rs, Rp } = out
+  // sinθ₂ = sinθ₁/n₂：倒数在循环外求一次，循环内只做乘法
+  const invN2 = 1 / n2
+
+  for (let i = 0; i < sinTheta1.length; i++) {
+    const c1 = cosTheta1[i]
+    const sinTheta2 = invN2 * sinTheta1[i]
+    const cosTheta2 = Math.sqrt(Math.max(0, 1 - sinTheta2 * sinTheta2))
+    const n2c2 = n2 * cosTheta2
+    const n2c1 = n2 * c1
+    const rs = (c1 - n2c2) / (c1 + n2c2)
+    const rp = (n2c1 - cosTheta2) / (n2c1 + cosTheta2)
+    Rs[i] = rs * rs
+    Rp[i] = rp * rp
+  }
+}
+
 /**
  * 角度转弧度
  * @param degrees 角度